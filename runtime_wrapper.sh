@@ -10,5 +10,10 @@ export LD_LIBRARY_PATH="$DIR:$LD_LIBRARY_PATH"
 export DYLD_LIBRARY_PATH="$DIR:$DYLD_LIBRARY_PATH"
 export DYLD_FALLBACK_LIBRARY_PATH="$DIR:$DYLD_FALLBACK_LIBRARY_PATH"
 
+# Render with the template fonts only, using the font cache built by `resumecli warmup` at install time
+if [ -f "$DIR/fontconfig/fonts.conf" ]; then
+    export RESUMECLI_FONT_CACHE_DIR="$DIR/fontconfig"
+fi
+
 # Run the application
 exec "$DIR/resumecli" "$@"
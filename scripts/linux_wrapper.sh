@@ -69,12 +69,22 @@ for BINARY_PATH in "$DIR/resumecli/resumecli" "$DIR/dist/resumecli/resumecli" "$
 export GI_TYPELIB_PATH="/usr/lib/x86_64-linux-gnu/girepository-1.0"
 export LD_LIBRARY_PATH="/usr/lib/x86_64-linux-gnu:\$LD_LIBRARY_PATH"
 
+# Render with the template fonts only, using the font cache built at install time
+if [ -f "$INSTALL_DIR/fontconfig/fonts.conf" ]; then
+    export RESUMECLI_FONT_CACHE_DIR="$INSTALL_DIR/fontconfig"
+fi
+
 # Run the resumecli binary from install dir
 exec "$INSTALL_DIR/resumecli" "\$@"
 EOF
 
         chmod +x "$INSTALL_DIR/resumecli_wrapper"
 
+        # Build the font cache now, fontconfig caches are keyed by the absolute path of the font directories
+        echo "Building the font cache..."
+        "$INSTALL_DIR/resumecli_wrapper" warmup --font-cache-dir "$INSTALL_DIR/fontconfig" || \
+            echo "Warning: could not build the font cache, the first PDF will take longer"
+
         break
     fi
 done
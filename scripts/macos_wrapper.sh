@@ -52,12 +52,22 @@ export DYLD_FALLBACK_LIBRARY_PATH="$HOMEBREW_PREFIX/lib"
 export PKG_CONFIG_PATH="$HOMEBREW_PREFIX/lib/pkgconfig"
 export GI_TYPELIB_PATH="$HOMEBREW_PREFIX/lib/girepository-1.0"
 
+# Render with the template fonts only, using the font cache built at install time
+if [ -f "$INSTALL_DIR/fontconfig/fonts.conf" ]; then
+    export RESUMECLI_FONT_CACHE_DIR="$INSTALL_DIR/fontconfig"
+fi
+
 # Run the resumecli binary
 "$INSTALL_DIR/resumecli" "\$@"
 EOF
 
         chmod +x "$INSTALL_DIR/resumecli_wrapper"
 
+        # Build the font cache now, fontconfig caches are keyed by the absolute path of the font directories
+        echo "Building the font cache..."
+        "$INSTALL_DIR/resumecli_wrapper" warmup --font-cache-dir "$INSTALL_DIR/fontconfig" || \
+            echo "Warning: could not build the font cache, the first PDF will take longer"
+
         break
     fi
 done
@@ -2,3 +2,8 @@ import os
 import sys
 
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+# The template fonts have to be configured before any module of the package imports WeasyPrint.
+from src.fonts import use_configured_template_fonts  # noqa: E402
+
+use_configured_template_fonts()
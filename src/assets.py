@@ -0,0 +1,208 @@
+import gzip
+import hashlib
+import mimetypes
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, cast
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+import anyio.to_thread
+import brotli
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Scope
+from weasyprint import default_url_fetcher
+
+from src.constants import STATIC_ASSETS_DIR
+
+_COMPRESSIBLE_SUFFIXES = {".css", ".js", ".json", ".svg", ".txt", ".ttf", ".otf", ".eot", ".woff"}
+_MEDIA_TYPES_BY_SUFFIX = {
+    ".ttf": "font/ttf",
+    ".otf": "font/otf",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".eot": "application/vnd.ms-fontobject",
+    ".svg": "image/svg+xml",
+}
+_ENCODERS = {
+    "br": lambda content: brotli.compress(content, quality=9),
+    "gzip": lambda content: gzip.compress(content, compresslevel=9, mtime=0),
+}
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass
+class StaticAsset:
+    content: bytes
+    media_type: str
+    etag: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.content) + sum(len(variant) for variant in self.encoded.values())
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        return f'"{self.etag}-{encoding}"' if encoding else f'"{self.etag}"'
+
+
+class StaticAssetStore:
+    """Loads static assets once, optionally precompresses them and keeps the most recently used ones in memory.
+
+    The cache is bounded by max_cached_bytes, counting both the original content and its compressed variants.
+    """
+
+    def __init__(
+        self,
+        directory: Path = STATIC_ASSETS_DIR,
+        max_cached_bytes: int = 32 * 1024 * 1024,
+        precompress: bool = True,
+    ):
+        self._directory = directory.resolve()
+        self._max_cached_bytes = max_cached_bytes
+        self._precompress = precompress
+        self._cached_bytes = 0
+        self._assets: "OrderedDict[str, StaticAsset]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def get(self, relative_path: str) -> Optional[StaticAsset]:
+        with self._lock:
+            asset = self._assets.get(relative_path)
+            if asset is not None:
+                self._assets.move_to_end(relative_path)
+                return asset
+
+        path = (self._directory / relative_path).resolve()
+        if not path.is_relative_to(self._directory) or not path.is_file():
+            return None
+        asset = self._load(path)
+
+        with self._lock:
+            if relative_path not in self._assets:
+                self._assets[relative_path] = asset
+                self._cached_bytes += asset.size
+            self._evict_least_recently_used()
+        return asset
+
+    def _load(self, path: Path) -> StaticAsset:
+        content = path.read_bytes()
+        media_type = _MEDIA_TYPES_BY_SUFFIX.get(path.suffix) or mimetypes.guess_type(path.name)[0]
+        asset = StaticAsset(
+            content=content,
+            media_type=media_type or "application/octet-stream",
+            etag=hashlib.sha256(content).hexdigest()[:32],
+        )
+        if self._precompress and path.suffix in _COMPRESSIBLE_SUFFIXES:
+            for encoding, encode in _ENCODERS.items():
+                encoded_content = encode(content)
+                if len(encoded_content) < len(content):
+                    asset.encoded[encoding] = encoded_content
+        return asset
+
+    def _evict_least_recently_used(self) -> None:
+        while self._cached_bytes > self._max_cached_bytes and len(self._assets) > 1:
+            _, evicted = self._assets.popitem(last=False)
+            self._cached_bytes -= evicted.size
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Serves static files from a StaticAssetStore, choosing a precompressed variant by Accept-Encoding.
+
+    Responses carry a strong ETag per variant and long-lived immutable caching headers, since static assets
+    only change with a new release of resumecli.
+    """
+
+    def __init__(self, directory: Path = STATIC_ASSETS_DIR, max_cached_bytes: int = 32 * 1024 * 1024):
+        super().__init__(directory=str(directory))
+        self._store = StaticAssetStore(directory, max_cached_bytes)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+        # Loading an asset reads and compresses it, which must not block the event loop serving preview sessions.
+        asset = await anyio.to_thread.run_sync(self._store.get, path)
+        if asset is None:
+            return await super().get_response(path, scope)
+
+        request_headers = Headers(scope=scope)
+        encoding = _preferred_encoding(request_headers.get("accept-encoding", ""), asset)
+        etag = asset.etag_for(encoding)
+        headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL, "Vary": "Accept-Encoding"}
+
+        if_none_match = request_headers.get("if-none-match", "")
+        if if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            content = asset.encoded[encoding]
+        else:
+            content = asset.content
+        return Response(content=content, media_type=asset.media_type, headers=headers)
+
+
+class TemplateAssetFetcher:
+    """A WeasyPrint url_fetcher that serves template assets from a StaticAssetStore.
+
+    Only data URLs and files inside the store's directory are allowed, so rendering never reads other files
+    or goes to the network. The assets served are recorded in used_assets, so an instance is meant to be
+    used for a single render.
+    """
+
+    def __init__(self, store: StaticAssetStore):
+        self._store = store
+        self.used_assets: Set[str] = set()
+
+    def __call__(self, url: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        if url.startswith("data:"):
+            return cast(Dict[str, Any], default_url_fetcher(url, *args, **kwargs))
+
+        parsed_url = urlsplit(url)
+        if parsed_url.scheme != "file":
+            raise ValueError(f"Fetching {url} is not allowed while rendering, only template assets are")
+        path = Path(url2pathname(parsed_url.path)).resolve()
+        if not path.is_relative_to(self._store.directory):
+            raise ValueError(f"Fetching {url} is not allowed while rendering, only template assets are")
+
+        relative_path = path.relative_to(self._store.directory).as_posix()
+        asset = self._store.get(relative_path)
+        if asset is None:
+            raise FileNotFoundError(f"Template asset {relative_path} does not exist")
+        self.used_assets.add(relative_path)
+        return {
+            "string": asset.content,
+            "mime_type": asset.media_type,
+            "redirected_url": url,
+            "filename": path.name,
+        }
+
+
+def _preferred_encoding(accept_encoding: str, asset: StaticAsset) -> Optional[str]:
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, parameters = part.partition(";")
+        quality = 1.0
+        name, _, value = parameters.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if coding.strip():
+            qualities[coding.strip().lower()] = quality
+
+    best_encoding: Optional[str] = None
+    best_quality = 0.0
+    for encoding in asset.encoded:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
@@ -0,0 +1,27 @@
+from io import BytesIO
+from typing import BinaryIO
+
+from pypdf import PdfReader, PdfWriter
+
+
+class PdfBundle:
+    """Joins the PDFs of resumes into one PDF, one resume at a time.
+
+    Each resume is appended as soon as its PDF is available, so the layouts of the resumes are not kept, but the
+    pages of every resume are kept in memory until the bundle is written. Bookmarks of the resumes themselves are
+    dropped, so that the outline of the bundle only lists the resumes.
+    """
+
+    def __init__(self, bookmarks: bool = True):
+        self._writer = PdfWriter()
+        self._bookmarks = bookmarks
+
+    def append(self, pdf: bytes, fallback_label: str) -> None:
+        """Appends the pages of a resume, bookmarked with its title or fallback_label if it has none."""
+        reader = PdfReader(BytesIO(pdf))
+        label = (reader.metadata.title if reader.metadata else None) or fallback_label
+        self._writer.append(reader, outline_item=label if self._bookmarks else None, import_outline=False)
+
+    def write(self, output: BinaryIO) -> None:
+        """Writes the bundle straight to output, without a copy of it in memory."""
+        self._writer.write(output)
@@ -1,16 +1,41 @@
 import asyncio
+import logging
+import multiprocessing
 import os
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
 
 import typer
 import uvicorn
 
+from src.constants import PROJECT_ROOT
+from src.fonts import ENV_KEY_FONT_CACHE_DIR, configured_font_cache_dir, default_font_cache_dir
+from src.loadtest import LoadTestConfig, run_load_test
+from src.manifest import (
+    DEFAULT_MANIFEST_NAME,
+    BuildManifest,
+    ManifestConflictError,
+    Shard,
+    hash_file_if_exists,
+    hash_template,
+)
 from src.renderer import ResumeRenderer, ResumeTemplate
 from src.server import ENV_KEY_RESUME_SOURCE_FILE, ENV_KEY_RESUME_TEMPLATE_NAME
-from src.service import ResumeService
+from src.service import InvalidResumeError, ResumeService, _write_atomically
+from src.warmup import warm_up
+from src.workers import PooledResumeRenderer, RenderWorkerPool
 
 app = typer.Typer()
 
 
+@app.callback()
+def main(verbose: bool = typer.Option(False, "--verbose", help="Log details such as per-render memory usage")) -> None:
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING, format="%(levelname)s %(name)s: %(message)s"
+    )
+
+
 @app.command()
 def preview(
     file: str = typer.Argument(..., help="Path to the source YAML file for the resume"),
@@ -25,17 +50,179 @@ def preview(
 
 @app.command()
 def build(
+    files: List[str] = typer.Argument(..., help="Paths to the source YAML files for the resumes"),
+    output: str = typer.Option("output.pdf", help="Output PDF file path when building a single resume"),
+    output_dir: Optional[str] = typer.Option(
+        None, help="Directory to write one PDF per source file to, required when building several resumes"
+    ),
+    template: ResumeTemplate = typer.Option(ResumeTemplate.MINIMAL_BLUE.value, help="Template to use for the resume"),
+    shard: Optional[str] = typer.Option(
+        None, help="Only build shard i of N of the source files, given as i/N with i starting from 1"
+    ),
+    manifest: Optional[str] = typer.Option(
+        None, help="Build manifest used to skip up-to-date resumes, defaults to a manifest in --output-dir"
+    ),
+    workers: int = typer.Option(1, min=1, help="Number of render worker processes when building several resumes"),
+    max_jobs_per_worker: int = typer.Option(100, help="Number of renders after which a render worker is recycled"),
+    max_worker_rss_mb: Optional[int] = typer.Option(
+        None, help="Resident memory in MB above which a render worker is recycled"
+    ),
+    watch: bool = typer.Option(False, "--watch", help="Keep the PDF up to date as the source file changes"),
+    debounce_ms: int = typer.Option(300, help="Time in milliseconds within which changes are handled together"),
+) -> None:
+    if watch:
+        if len(files) != 1 or output_dir is not None or shard is not None:
+            raise typer.BadParameter("--watch builds a single resume to --output", param_hint="--watch")
+        _watch_build(files[0], output, template, debounce_ms)
+        return
+
+    if len(files) == 1 and output_dir is None:
+        output_paths = {files[0]: output}
+    elif output_dir is None:
+        raise typer.BadParameter("--output-dir is required when building several resumes", param_hint="--output-dir")
+    else:
+        output_paths = _output_paths_in_dir(files, Path(output_dir))
+
+    manifest_name = DEFAULT_MANIFEST_NAME
+    selected_shard: Optional[Shard] = None
+    if shard is not None:
+        try:
+            selected_shard = Shard.parse(shard)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--shard") from e
+        output_paths = {source: out for source, out in output_paths.items() if selected_shard.contains(source)}
+        manifest_name = selected_shard.manifest_name()
+    if manifest is None and output_dir is not None:
+        manifest = str(Path(output_dir) / manifest_name)
+    # A sharded build only writes its own entries to its shard's manifest, even when reading another manifest such
+    # as a merged one, so that the manifests of all shards can be merged again after the next round of builds.
+    output_manifest = manifest
+    if selected_shard is not None and manifest is not None:
+        output_manifest = str(Path(output_dir or os.path.dirname(manifest)) / manifest_name)
+
+    template_hash = hash_template(PROJECT_ROOT / "templates", template.value)
+    input_hashes = {source: hash_file_if_exists(source) for source in output_paths}
+    build_manifest = BuildManifest.load(manifest) if manifest is not None else None
+    if build_manifest is not None:
+        output_paths = {
+            source: out
+            for source, out in output_paths.items()
+            if not build_manifest.is_up_to_date(source, out, input_hashes[source], template_hash)
+        }
+        typer.echo(f"Skipping {len(input_hashes) - len(output_paths)} up-to-date resumes...")
+
+    built_output_paths: Dict[str, str] = {}
+    errors: Dict[str, str] = {}
+
+    async def record_built(source: str, out: str) -> None:
+        built_output_paths[source] = out
+
+    try:
+        if len(output_paths) == 1:
+            typer.echo(f"Building resume from {next(iter(output_paths))}...")
+
+            async def build_resume():
+                service = ResumeService(renderer=ResumeRenderer())
+                errors.update(
+                    await service.generate_pdfs(output_paths, template=template, on_resume_built=record_built)
+                )
+
+            asyncio.run(build_resume())
+        elif output_paths:
+            typer.echo(f"Building {len(output_paths)} resumes into {output_dir}...")
+
+            async def build_resumes():
+                max_worker_rss_bytes = max_worker_rss_mb * 1024 * 1024 if max_worker_rss_mb is not None else None
+                with RenderWorkerPool(workers, max_jobs_per_worker, max_worker_rss_bytes) as worker_pool:
+                    service = ResumeService(renderer=PooledResumeRenderer(worker_pool))
+                    errors.update(
+                        await service.generate_pdfs(
+                            output_paths, template=template, concurrency=workers, on_resume_built=record_built
+                        )
+                    )
+
+            asyncio.run(build_resumes())
+    finally:
+        # Resumes that were built are recorded even when another one failed, so they are not built again.
+        if build_manifest is not None and output_manifest is not None:
+            for source, out in built_output_paths.items():
+                input_hash = input_hashes[source]
+                if input_hash is not None:
+                    build_manifest.record(source, out, input_hash, template_hash)
+            if selected_shard is not None:
+                build_manifest = build_manifest.for_shard(selected_shard)
+            build_manifest.save(output_manifest)
+            typer.echo(f"Build manifest written to {output_manifest}")
+
+    for source, error in errors.items():
+        typer.echo(f"{source}: {error}", err=True)
+    if errors:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def bundle(
+    files: List[str] = typer.Argument(..., help="Paths to the source YAML files for the resumes, in bundle order"),
+    output: str = typer.Option("bundle.pdf", help="Output PDF file path"),
+    template: ResumeTemplate = typer.Option(ResumeTemplate.MINIMAL_BLUE.value, help="Template to use for the resumes"),
+    workers: int = typer.Option(4, min=1, help="Number of render worker processes"),
+    max_jobs_per_worker: int = typer.Option(100, help="Number of renders after which a render worker is recycled"),
+    max_worker_rss_mb: Optional[int] = typer.Option(
+        None, help="Resident memory in MB above which a render worker is recycled"
+    ),
+    bookmarks: bool = typer.Option(True, help="Add a bookmark for each resume to the bundle"),
+) -> None:
+    typer.echo(f"Bundling {len(files)} resumes into {output}...")
+
+    async def build_bundle():
+        max_worker_rss_bytes = max_worker_rss_mb * 1024 * 1024 if max_worker_rss_mb is not None else None
+        with RenderWorkerPool(workers, max_jobs_per_worker, max_worker_rss_bytes) as worker_pool:
+            service = ResumeService(renderer=PooledResumeRenderer(worker_pool))
+            await service.generate_bundle(files, output, template=template, concurrency=workers, bookmarks=bookmarks)
+
+    try:
+        asyncio.run(build_bundle())
+    except InvalidResumeError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def check(
     file: str = typer.Argument(..., help="Path to the source YAML file for the resume"),
-    output: str = typer.Option("output.pdf", help="Output PDF file path"),
     template: ResumeTemplate = typer.Option(ResumeTemplate.MINIMAL_BLUE.value, help="Template to use for the resume"),
+    max_pages: Optional[int] = typer.Option(None, min=1, help="Maximum number of pages the resume may have"),
+    output: Optional[str] = typer.Option(None, help="Also write the PDF to this path, from the same layout"),
 ) -> None:
-    typer.echo(f"Building resume from {file}...")
+    service = ResumeService(renderer=ResumeRenderer())
+    result = asyncio.run(service.check(cv_data_path=file, template=template, max_pages=max_pages))
+
+    for error in result.errors:
+        typer.echo(error, err=True)
+    if result.laid_out_resume is not None:
+        typer.echo(f"{file}: {result.laid_out_resume.page_count} pages")
+        if output is not None:
+            _write_atomically(output, result.laid_out_resume.write_pdf())
+            typer.echo(f"PDF written to {output}")
+    for warning in result.warnings:
+        typer.echo(f"Warning: {warning}", err=True)
+
+    if not result.passed:
+        raise typer.Exit(code=1)
 
-    async def build_resume():
-        service = ResumeService(renderer=ResumeRenderer())
-        await service.generate_pdf(cv_data_path=file, output_path=output, template=template)
 
-    asyncio.run(build_resume())
+@app.command("merge-manifests")
+def merge_manifests(
+    manifests: List[str] = typer.Argument(..., help="Paths to the build manifests to merge, e.g. one per shard"),
+    output: str = typer.Option(DEFAULT_MANIFEST_NAME, help="Path of the merged build manifest"),
+) -> None:
+    try:
+        merged = BuildManifest.merge(BuildManifest.load(manifest) for manifest in manifests)
+    except ManifestConflictError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(code=1)
+    merged.save(output)
+    typer.echo(f"Merged {len(manifests)} manifests with {len(merged.entries)} entries into {output}")
 
 
 @app.command()
@@ -46,5 +233,89 @@ def new(file: str = typer.Argument(..., help="Path where the new resume YAML fil
     typer.echo(f"Schema file copied to {result.schema_path}")
 
 
+@app.command()
+def warmup(
+    font_cache_dir: Optional[Path] = typer.Option(
+        None, help=f"Directory for the template font cache, defaults to ${ENV_KEY_FONT_CACHE_DIR} or a user cache dir"
+    ),
+    template: ResumeTemplate = typer.Option(ResumeTemplate.MINIMAL_BLUE.value, help="Template to warm up"),
+) -> None:
+    font_cache_dir = font_cache_dir or configured_font_cache_dir() or default_font_cache_dir()
+    typer.echo(f"Building the template font cache in {font_cache_dir} and timing the first PDF of new processes...")
+    try:
+        result = warm_up(template, font_cache_dir)
+    except subprocess.CalledProcessError as e:
+        typer.echo(f"Building the sample resume failed:\n{e.stderr}", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(f"First PDF with the system fonts: {result.system_fonts_first_pdf_seconds * 1000:.0f} ms")
+    typer.echo(f"First PDF with the template font cache: {result.template_fonts_first_pdf_seconds * 1000:.0f} ms")
+    if configured_font_cache_dir() != font_cache_dir:
+        typer.echo(f"Set {ENV_KEY_FONT_CACHE_DIR}={font_cache_dir} to render with the template fonts only")
+
+
+@app.command(hidden=True)
+def loadtest(
+    sessions: int = typer.Option(10, min=1, help="Number of concurrent preview sessions to open"),
+    edits_per_second: float = typer.Option(1.0, min=0.01, help="Rate at which the resume file is edited"),
+    duration: float = typer.Option(30.0, min=0, help="Duration of the editing phase in seconds"),
+    template: ResumeTemplate = typer.Option(ResumeTemplate.MINIMAL_BLUE.value, help="Template to use for the resume"),
+    port: int = typer.Option(8765, help="Port to run the preview server under test on"),
+    report: str = typer.Option("loadtest-report.json", help="Path of the JSON report to write"),
+) -> None:
+    typer.echo(f"Load testing the preview server with {sessions} sessions for {duration} seconds...")
+    config = LoadTestConfig(
+        sessions=sessions,
+        edits_per_second=edits_per_second,
+        duration_seconds=duration,
+        template=template,
+        port=port,
+    )
+    result = run_load_test(config)
+    result.write(report)
+
+    latency = result.time_to_update
+    typer.echo(f"Edits: {result.edits}, updates received: {result.updates}")
+    typer.echo(f"Throughput: {result.throughput_updates_per_second:.2f} updates/s")
+    typer.echo(f"Time to update (ms): p50={latency.p50_ms} p95={latency.p95_ms} p99={latency.p99_ms}")
+    typer.echo(f"Server RSS (bytes): {result.server_rss_bytes}")
+    typer.echo(f"Report written to {report}")
+
+
+def _watch_build(file: str, output: str, template: ResumeTemplate, debounce_ms: int) -> None:
+    typer.echo(f"Watching {file} and building it into {output}, press Ctrl+C to stop...")
+
+    async def report_pdf_written(output_path: str) -> None:
+        typer.echo(f"Updated {output_path}")
+
+    async def report_error(error_message: str) -> None:
+        typer.echo(f"{error_message}\nKeeping the last PDF built from {file}", err=True)
+
+    async def watch_resume():
+        service = ResumeService(renderer=ResumeRenderer())
+        await service.watch_pdf(
+            cv_data_path=file,
+            output_path=output,
+            template=template,
+            debounce_ms=debounce_ms,
+            on_pdf_written=report_pdf_written,
+            on_error=report_error,
+        )
+
+    asyncio.run(watch_resume())
+
+
+def _output_paths_in_dir(files: List[str], output_dir: Path) -> Dict[str, str]:
+    output_paths: Dict[str, str] = {}
+    for file in files:
+        output_path = str(output_dir / f"{Path(file).stem}.pdf")
+        if output_path in output_paths.values():
+            raise typer.BadParameter(f"More than one source file would be built into {output_path}")
+        output_paths[file] = output_path
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_paths
+
+
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app()
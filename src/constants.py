@@ -1,3 +1,4 @@
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STATIC_ASSETS_DIR = PROJECT_ROOT / "templates" / "static"
@@ -0,0 +1,75 @@
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+from xml.sax.saxutils import escape
+
+from src.constants import STATIC_ASSETS_DIR
+
+ENV_KEY_FONT_CACHE_DIR = "RESUMECLI_FONT_CACHE_DIR"
+FONTCONFIG_FILE_NAME = "fonts.conf"
+
+TEMPLATE_FONT_DIRS = [
+    STATIC_ASSETS_DIR / "fonts",
+    STATIC_ASSETS_DIR / "css" / "fontawesome" / "fontawesome-free-6.4.0-web" / "webfonts",
+]
+TEMPLATE_FONT_FAMILY = "Inter"
+
+_GENERIC_FONT_FAMILIES = ["sans-serif", "serif", "monospace"]
+
+logger = logging.getLogger(__name__)
+
+
+def default_font_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "resumecli" / "fontconfig"
+
+
+def configured_font_cache_dir() -> Optional[Path]:
+    cache_dir = os.environ.get(ENV_KEY_FONT_CACHE_DIR)
+    return Path(cache_dir) if cache_dir else None
+
+
+def render_fontconfig(cache_dir: Path, font_dirs: List[Path] = TEMPLATE_FONT_DIRS) -> str:
+    """Renders a fontconfig configuration that only knows about the template fonts.
+
+    System configuration is not included, so fontconfig never scans or validates the system font directories,
+    and generic families such as sans-serif fall back to the template font.
+    """
+    lines = [
+        '<?xml version="1.0"?>',
+        '<!DOCTYPE fontconfig SYSTEM "urn:fontconfig:fonts.dtd">',
+        "<fontconfig>",
+    ]
+    lines.extend(f"  <dir>{escape(str(font_dir.resolve()))}</dir>" for font_dir in font_dirs)
+    lines.append(f"  <cachedir>{escape(str(cache_dir.resolve()))}</cachedir>")
+    for family in _GENERIC_FONT_FAMILIES:
+        lines.append(
+            f"  <alias><family>{family}</family><prefer><family>{TEMPLATE_FONT_FAMILY}</family></prefer></alias>"
+        )
+    lines.append("</fontconfig>")
+    return "\n".join(lines) + "\n"
+
+
+def use_configured_template_fonts() -> None:
+    """Uses the template fonts if RESUMECLI_FONT_CACHE_DIR is set, or the system fonts if they cannot be cached."""
+    cache_dir = configured_font_cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        use_template_fonts(cache_dir)
+    except OSError as e:
+        logger.warning("Could not cache the template fonts in %s, using the system fonts: %s", cache_dir, e)
+
+
+def use_template_fonts(cache_dir: Path) -> Path:
+    """Points fontconfig to a configuration with only the template fonts, cached in cache_dir."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    config_path = cache_dir / FONTCONFIG_FILE_NAME
+    config = render_fontconfig(cache_dir)
+    # Only rewrite the configuration when it changed, e.g. after resumecli moved, so that processes starting
+    # at the same time do not rewrite a file the others are reading.
+    if not config_path.is_file() or config_path.read_text() != config:
+        config_path.write_text(config)
+    os.environ["FONTCONFIG_FILE"] = str(config_path)
+    return config_path
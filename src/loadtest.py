@@ -0,0 +1,241 @@
+import asyncio
+import json
+import math
+import os
+import platform
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import yaml
+from websockets.asyncio.client import ClientConnection, connect
+
+from src.constants import PROJECT_ROOT
+from src.memory import get_rss_bytes
+from src.renderer import ResumeTemplate
+from src.server import ENV_KEY_RESUME_SOURCE_FILE, ENV_KEY_RESUME_TEMPLATE_NAME, PING_MESSAGE
+
+_EDIT_MARKER_PATTERN = re.compile(r"loadtest-edit-(\d+)")
+_SERVER_STARTUP_TIMEOUT_SECONDS = 30.0
+_RSS_SAMPLING_INTERVAL_SECONDS = 0.5
+
+
+@dataclass
+class LoadTestConfig:
+    sessions: int
+    edits_per_second: float
+    duration_seconds: float
+    template: ResumeTemplate
+    port: int
+    settle_seconds: float = 5.0
+
+
+@dataclass
+class LatencySummary:
+    count: int
+    p50_ms: Optional[float]
+    p95_ms: Optional[float]
+    p99_ms: Optional[float]
+    max_ms: Optional[float]
+
+    @classmethod
+    def from_latencies(cls, latencies_ms: Sequence[float]) -> "LatencySummary":
+        return cls(
+            count=len(latencies_ms),
+            p50_ms=percentile(latencies_ms, 50),
+            p95_ms=percentile(latencies_ms, 95),
+            p99_ms=percentile(latencies_ms, 99),
+            max_ms=max(latencies_ms) if latencies_ms else None,
+        )
+
+
+@dataclass
+class LoadTestReport:
+    """Results of one load test run, written as JSON so that runs can be compared between releases."""
+
+    config: Dict[str, Any]
+    edits: int
+    updates: int
+    elapsed_seconds: float
+    throughput_updates_per_second: float
+    time_to_update: LatencySummary
+    server_rss_bytes: Dict[str, Optional[int]]
+    environment: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def write(self, report_path: str) -> None:
+        with open(report_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+
+def percentile(values: Sequence[float], percent: float) -> Optional[float]:
+    """Returns the percentile of the values using linear interpolation between closest ranks."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * percent / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class _LoadTestRun:
+    def __init__(self, config: LoadTestConfig, resume_path: Path, resume_data: Dict[str, Any]):
+        self._config = config
+        self._resume_path = resume_path
+        self._resume_data = resume_data
+        self._edit_times: Dict[int, float] = {}
+        self._latencies_ms: List[float] = []
+        self._rss_samples: List[int] = []
+
+    async def run(self, server_pid: int) -> LoadTestReport:
+        uri = f"ws://127.0.0.1:{self._config.port}/ws"
+        connections = [await connect(uri) for _ in range(self._config.sessions)]
+        session_tasks = [asyncio.create_task(self._listen(connection)) for connection in connections]
+        sampling_task = asyncio.create_task(self._sample_rss(server_pid))
+        rss_at_start = get_rss_bytes(server_pid)
+
+        started_at = time.perf_counter()
+        edits = await self._edit_for(self._config.duration_seconds)
+        await asyncio.sleep(self._config.settle_seconds)
+        elapsed_seconds = time.perf_counter() - started_at
+
+        rss_at_end = get_rss_bytes(server_pid)
+        sampling_task.cancel()
+        for connection in connections:
+            await connection.close()
+        await asyncio.gather(*session_tasks, sampling_task, return_exceptions=True)
+
+        return LoadTestReport(
+            config={**asdict(self._config), "template": self._config.template.value},
+            edits=edits,
+            updates=len(self._latencies_ms),
+            elapsed_seconds=elapsed_seconds,
+            throughput_updates_per_second=len(self._latencies_ms) / elapsed_seconds,
+            time_to_update=LatencySummary.from_latencies(self._latencies_ms),
+            server_rss_bytes={
+                "start": rss_at_start,
+                "end": rss_at_end,
+                "peak": max(self._rss_samples, default=None),
+            },
+            environment=_describe_environment(),
+        )
+
+    async def _edit_for(self, duration_seconds: float) -> int:
+        interval = 1 / self._config.edits_per_second
+        deadline = time.perf_counter() + duration_seconds
+        edit_number = 0
+        while time.perf_counter() < deadline:
+            edit_number += 1
+            self.write_edit(edit_number)
+            await asyncio.sleep(interval)
+        return edit_number
+
+    def write_edit(self, edit_number: int) -> None:
+        resume_data = {**self._resume_data, "name": f"loadtest-edit-{edit_number}"}
+        self._edit_times[edit_number] = time.perf_counter()
+        with open(self._resume_path, "w") as f:
+            yaml.safe_dump(resume_data, f, sort_keys=False)
+
+    async def _listen(self, connection: ClientConnection) -> None:
+        async for message in connection:
+            if message == PING_MESSAGE:
+                await connection.send("pong")
+                continue
+            received_at = time.perf_counter()
+            match = _EDIT_MARKER_PATTERN.search(str(message))
+            if match and int(match.group(1)) > 0:
+                edit_time = self._edit_times[int(match.group(1))]
+                self._latencies_ms.append((received_at - edit_time) * 1000)
+
+    async def _sample_rss(self, server_pid: int) -> None:
+        while True:
+            rss = get_rss_bytes(server_pid)
+            if rss is not None:
+                self._rss_samples.append(rss)
+            await asyncio.sleep(_RSS_SAMPLING_INTERVAL_SECONDS)
+
+
+def run_load_test(config: LoadTestConfig) -> LoadTestReport:
+    """Runs a preview server locally, drives it with concurrent preview sessions and measures time-to-update.
+
+    Every edit puts a unique marker into the resume, so an update received on a session can be matched to
+    the edit that produced it. Edits that are coalesced by the file watcher are not counted as updates.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        resume_path = Path(temp_dir) / "cv.yaml"
+        with open(PROJECT_ROOT / "cv.sample.yaml", "r") as f:
+            resume_data = yaml.safe_load(f)
+        resume_data.pop("$schema", None)
+        load_test_run = _LoadTestRun(config, resume_path, resume_data)
+        # The initial content has to exist before the server starts watching it.
+        load_test_run.write_edit(0)
+
+        server = _start_server(config, resume_path)
+        try:
+            _wait_for_port(config.port, server)
+            return asyncio.run(load_test_run.run(server.pid))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def _start_server(config: LoadTestConfig, resume_path: Path) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        ENV_KEY_RESUME_SOURCE_FILE: str(resume_path),
+        ENV_KEY_RESUME_TEMPLATE_NAME: config.template.value,
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.server:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(config.port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=PROJECT_ROOT,
+        env=env,
+    )
+
+
+def _wait_for_port(port: int, server: subprocess.Popen) -> None:
+    deadline = time.monotonic() + _SERVER_STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Preview server exited with code {server.returncode} before accepting connections")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Preview server did not accept connections on port {port}")
+
+
+def _describe_environment() -> Dict[str, str]:
+    try:
+        version = metadata.version("resumecli")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return {
+        "resumecli_version": version,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
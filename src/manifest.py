@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_NAME = "resumecli-manifest.json"
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ManifestConflictError(Exception):
+    def __init__(self, source_path: str):
+        super().__init__(f"Manifests disagree about the build of {source_path}")
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One of `count` disjoint partitions of the source files, numbered from 1."""
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        index, separator, count = value.partition("/")
+        if not separator or not index.isdigit() or not count.isdigit():
+            raise ValueError(f"Shard should be formatted as i/N, got '{value}'")
+        shard = cls(index=int(index), count=int(count))
+        if not 1 <= shard.index <= shard.count:
+            raise ValueError(f"Shard index should be between 1 and {shard.count}, got {shard.index}")
+        return shard
+
+    def contains(self, source_path: str) -> bool:
+        """Partitions by a hash of the normalized path, so all nodes agree on the shard of a source file."""
+        digest = hashlib.sha256(normalize_source_path(source_path).encode()).digest()
+        return int.from_bytes(digest[:8], "big") % self.count == self.index - 1
+
+    def manifest_name(self) -> str:
+        return f"resumecli-manifest.shard-{self.index}-of-{self.count}.json"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    input_hash: str
+    template_hash: str
+    output_hash: str
+    output_path: str
+
+
+@dataclass
+class BuildManifest:
+    """Records what each source file was last built from, so that unchanged resumes are not built again.
+
+    Entries are keyed by normalized source path, which should be relative to the corpus root for manifests
+    to be shared between build nodes.
+    """
+
+    entries: Dict[str, ManifestEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, manifest_path: str) -> "BuildManifest":
+        if not os.path.exists(manifest_path):
+            return cls()
+        with open(manifest_path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version in {manifest_path}: {data.get('version')}")
+        return cls(entries={source: ManifestEntry(**entry) for source, entry in data["entries"].items()})
+
+    @classmethod
+    def merge(cls, manifests: Iterable["BuildManifest"]) -> "BuildManifest":
+        merged = cls()
+        for manifest in manifests:
+            for source_path, entry in manifest.entries.items():
+                if merged.entries.get(source_path, entry) != entry:
+                    raise ManifestConflictError(source_path)
+                merged.entries[source_path] = entry
+        return merged
+
+    def for_shard(self, shard: Shard) -> "BuildManifest":
+        """Keeps only the entries of the shard, so that manifests of different shards can always be merged."""
+        return BuildManifest(
+            entries={source: entry for source, entry in self.entries.items() if shard.contains(source)}
+        )
+
+    def save(self, manifest_path: str) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "entries": {source: asdict(entry) for source, entry in sorted(self.entries.items())},
+        }
+        temporary_path = f"{manifest_path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        os.replace(temporary_path, manifest_path)
+
+    def is_up_to_date(self, source_path: str, output_path: str, input_hash: Optional[str], template_hash: str) -> bool:
+        entry = self.entries.get(normalize_source_path(source_path))
+        if entry is None or input_hash is None:
+            return False
+        if (entry.input_hash, entry.template_hash, entry.output_path) != (input_hash, template_hash, output_path):
+            return False
+        return os.path.exists(output_path) and hash_file(output_path) == entry.output_hash
+
+    def record(self, source_path: str, output_path: str, input_hash: str, template_hash: str) -> None:
+        self.entries[normalize_source_path(source_path)] = ManifestEntry(
+            input_hash=input_hash,
+            template_hash=template_hash,
+            output_hash=hash_file(output_path),
+            output_path=output_path,
+        )
+
+
+def normalize_source_path(source_path: str) -> str:
+    return Path(os.path.normpath(source_path)).as_posix()
+
+
+def hash_file_if_exists(path: str) -> Optional[str]:
+    return hash_file(path) if os.path.isfile(path) else None
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def hash_template(template_dir: Path, template_name: str) -> str:
+    """Hashes everything in the template directory, since templates extend each other and share assets."""
+    digest = hashlib.sha256(template_name.encode())
+    for path in sorted(p for p in template_dir.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(template_dir).as_posix().encode())
+        digest.update(hash_file(str(path)).encode())
+    return digest.hexdigest()
@@ -0,0 +1,54 @@
+import os
+import resource
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+def get_rss_bytes(pid: int) -> Optional[int]:
+    """Returns the resident set size of a process, or None when it cannot be determined."""
+    status_path = Path(f"/proc/{pid}/status")
+    if status_path.exists():
+        return _read_proc_status_field(status_path, "VmRSS")
+
+    try:
+        output = subprocess.run(
+            ["ps", "-o", "rss=", "-p", str(pid)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return int(output) * 1024 if output else None
+
+
+def reset_peak_rss() -> None:
+    """Resets the peak resident set size of the current process, which is only supported on Linux."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def get_peak_rss_bytes() -> Optional[int]:
+    """Returns the peak resident set size of the current process since start or since the last reset."""
+    status_path = Path(f"/proc/{os.getpid()}/status")
+    if status_path.exists():
+        return _read_proc_status_field(status_path, "VmHWM")
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def _read_proc_status_field(status_path: Path, field: str) -> Optional[int]:
+    try:
+        lines = status_path.read_text().splitlines()
+    except OSError:
+        return None
+    for line in lines:
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1]) * 1024
+    return None
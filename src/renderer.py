@@ -1,16 +1,24 @@
 import json
+import logging
+from dataclasses import dataclass
 from enum import Enum
-from functools import cached_property
-from typing import Any, Dict, cast
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, cast
 
 import jsonschema
 import markdown
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2.utils import htmlsafe_json_dumps
 from markupsafe import Markup
-from weasyprint import HTML
+from weasyprint import HTML, Document
 
+from src.assets import StaticAssetStore, TemplateAssetFetcher
 from src.constants import PROJECT_ROOT
 
+logger = logging.getLogger(__name__)
+
 
 class ResumeTemplate(Enum):
     MINIMAL_BLUE = "minimal_blue"
@@ -21,19 +29,60 @@ class ResumeTemplate(Enum):
 
 
 class ResumeDataValidationError(Exception):
-    def __init__(self, cause: jsonschema.exceptions.ValidationError):
-        super().__init__(f"Failed to validate resume data: {cause}")
+    def __init__(self, *causes: jsonschema.exceptions.ValidationError):
+        self.causes: List[jsonschema.exceptions.ValidationError] = list(causes)
+        details = "\n".join(self._describe(cause) for cause in self.causes)
+        separator = "\n" if len(self.causes) > 1 else " "
+        super().__init__(f"Failed to validate resume data:{separator}{details}")
+
+    @staticmethod
+    def _describe(cause: jsonschema.exceptions.ValidationError) -> str:
+        if not cause.path:
+            return cause.message
+        return f"{cause.json_path}: {cause.message}"
+
+
+@dataclass
+class LaidOutResume:
+    """A resume laid out once, from which its page count, overflow warnings and PDF are all produced."""
+
+    document: Document
+    used_assets: FrozenSet[str]
+
+    @property
+    def title(self) -> Optional[str]:
+        return cast(Optional[str], self.document.metadata.title)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.document.pages)
+
+    def overflow_warnings(self, max_pages: Optional[int]) -> List[str]:
+        if max_pages is None or self.page_count <= max_pages:
+            return []
+
+        warnings = [f"Resume has {self.page_count} pages, which is more than the limit of {max_pages}"]
+        for page_number, page in enumerate(self.document.pages[max_pages:], start=max_pages + 1):
+            headings = [label for _, label, _, _ in page.bookmarks]
+            if headings:
+                warnings.append(f"Page {page_number} starts the sections: {', '.join(headings)}")
+        return warnings
+
+    def write_pdf(self) -> bytes:
+        return cast(bytes, self.document.write_pdf())
 
 
 class ResumeRenderer:
     _template_dir = PROJECT_ROOT / "templates"
     _schema_path = PROJECT_ROOT / "cv.schema.json"
+    _template_assets = StaticAssetStore(max_cached_bytes=64 * 1024 * 1024, precompress=False)
 
-    def __init__(self) -> None:
+    def __init__(self, max_validation_errors: int = 10) -> None:
         self.env = Environment(
             loader=FileSystemLoader(self._template_dir),
             autoescape=select_autoescape(["html", "xml"]),
         )
+        self._max_validation_errors = max_validation_errors
 
     def render_resume(self, resume_data: Dict[str, Any], resume_template: ResumeTemplate) -> str:
         self._validate_resume_data(resume_data)
@@ -43,21 +92,40 @@ class ResumeRenderer:
 
     def render_error(self, error_message: str) -> str:
         template = self.env.get_template("error.html")
-        return template.render(error_message=error_message, json_schema=self._schema)
+        return template.render(error_message=error_message, json_schema=self._rendered_schema)
+
+    def render_error_details(self, error_message: str) -> str:
+        """Renders only the error details fragment of the error page, without the schema reference."""
+        template = self.env.get_template("error_details.html")
+        return template.render(error_message=error_message)
 
     def generate_pdf(self, rendered_resume: str) -> bytes:
-        return cast(bytes, HTML(string=rendered_resume, base_url=PROJECT_ROOT / "templates").write_pdf())
+        return self.lay_out(rendered_resume).write_pdf()
+
+    def lay_out(self, rendered_resume: str) -> LaidOutResume:
+        """Lays out the rendered resume into pages that can be inspected and written without laying them out again."""
+        url_fetcher = TemplateAssetFetcher(self._template_assets)
+        html = HTML(string=rendered_resume, base_url=self._template_dir, url_fetcher=url_fetcher)
+        document = html.render()
+        logger.debug("Laid out resume using template assets: %s", sorted(url_fetcher.used_assets))
+        return LaidOutResume(document=document, used_assets=frozenset(url_fetcher.used_assets))
 
     def _validate_resume_data(self, resume_data: Dict[str, Any]) -> None:
-        try:
-            jsonschema.validate(instance=resume_data, schema=self._schema)
-        except jsonschema.exceptions.ValidationError as e:
-            raise ResumeDataValidationError(e) from e
+        errors = list(islice(self._validator.iter_errors(resume_data), self._max_validation_errors))
+        if errors:
+            raise ResumeDataValidationError(*errors) from errors[0]
 
-    @cached_property
+    @property
     def _schema(self) -> Dict[str, Any]:
-        with open(self._schema_path, "r") as schema_file:
-            return cast(Dict[str, Any], json.load(schema_file))
+        return _load_schema(self._schema_path)
+
+    @property
+    def _validator(self) -> jsonschema.protocols.Validator:
+        return _load_validator(self._schema_path)
+
+    @property
+    def _rendered_schema(self) -> Markup:
+        return _render_schema(self._schema_path)
 
     def _markdown_to_html(self, markdown_text: str) -> Markup:
         html = markdown.markdown(markdown_text.strip(), extensions=["fenced_code", "tables"])
@@ -80,3 +148,23 @@ class ResumeRenderer:
         if isinstance(data, tuple):
             return tuple(self._turn_to_html_recursively(item) for item in data)
         return data
+
+
+@lru_cache(maxsize=None)
+def _load_schema(schema_path: Path) -> Dict[str, Any]:
+    with open(schema_path, "r") as schema_file:
+        return cast(Dict[str, Any], json.load(schema_file))
+
+
+@lru_cache(maxsize=None)
+def _load_validator(schema_path: Path) -> jsonschema.protocols.Validator:
+    """Checks the schema and builds its validator once per process, shared by all renderers."""
+    schema = _load_schema(schema_path)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@lru_cache(maxsize=None)
+def _render_schema(schema_path: Path) -> Markup:
+    return htmlsafe_json_dumps(_load_schema(schema_path), indent=2, sort_keys=True)
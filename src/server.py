@@ -3,16 +3,15 @@ import os
 
 from fastapi import Depends, FastAPI, WebSocket
 from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
 from starlette.websockets import WebSocketDisconnect
 
-from src.constants import PROJECT_ROOT
+from src.assets import PrecompressedStaticFiles
 from src.renderer import ResumeRenderer, ResumeTemplate
 from src.service import ResumeService
 
 app = FastAPI()
 
-app.mount("/static", StaticFiles(directory=str(PROJECT_ROOT / "templates" / "static")), name="static")
+app.mount("/static", PrecompressedStaticFiles(), name="static")
 
 ENV_KEY_RESUME_SOURCE_FILE = "RESUME_SOURCE_FILE"
 ENV_KEY_RESUME_TEMPLATE_NAME = "RESUME_TEMPLATE"
@@ -37,6 +36,16 @@ html = """
                         ws.send('pong');
                         return;
                     }
+                    if (event.data.startsWith('error-details:')) {
+                        const errorDetails = event.data.substring('error-details:'.length);
+                        const errorDetailsElement = document.getElementById('error-details');
+                        if (errorDetailsElement) {
+                            errorDetailsElement.outerHTML = errorDetails;
+                        } else {
+                            document.body.innerHTML = errorDetails;
+                        }
+                        return;
+                    }
                     document.body.innerHTML = event.data;
                 };
 
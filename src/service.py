@@ -1,16 +1,34 @@
+import asyncio
+import logging
+import os
 import shutil
+import tempfile
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Awaitable, Callable
+from typing import Awaitable, BinaryIO, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import yaml
 from typing_extensions import TypeAlias
 from watchfiles import awatch
 
+from src.bundle import PdfBundle
 from src.constants import PROJECT_ROOT
-from src.renderer import ResumeDataValidationError, ResumeRenderer, ResumeTemplate
+from src.renderer import LaidOutResume, ResumeDataValidationError, ResumeRenderer, ResumeTemplate
 
 PreviewUpdatedCallback: TypeAlias = Callable[[str], Awaitable[None]]
+PdfWrittenCallback: TypeAlias = Callable[[str], Awaitable[None]]
+WatchErrorCallback: TypeAlias = Callable[[str], Awaitable[None]]
+ResumeBuiltCallback: TypeAlias = Callable[[str, str], Awaitable[None]]
+
+logger = logging.getLogger(__name__)
+
+ERROR_DETAILS_MESSAGE_PREFIX = "error-details:"
+
+
+class InvalidResumeError(Exception):
+    """A source file that could not be read or does not validate, described by the message."""
 
 
 @dataclass
@@ -21,6 +39,19 @@ class NewResumeResult:
     schema_path: Path
 
 
+@dataclass
+class ResumeCheckResult:
+    """Results from checking a resume against its schema and a page limit, based on a single layout."""
+
+    errors: List[str]
+    warnings: List[str]
+    laid_out_resume: Optional[LaidOutResume] = None
+
+    @property
+    def passed(self) -> bool:
+        return not self.errors and not self.warnings
+
+
 class ResumeService:
     def __init__(self, renderer: ResumeRenderer):
         self._renderer = renderer
@@ -32,20 +63,171 @@ class ResumeService:
         template: ResumeTemplate,
     ) -> None:
         async def write_to_pdf_file(preview_content: str) -> None:
-            with open(output_path, "wb") as f:
-                f.write(self._renderer.generate_pdf(preview_content))
+            pdf = await asyncio.to_thread(self._renderer.generate_pdf, preview_content)
+            _write_atomically(output_path, pdf)
 
         await self._update_preview(cv_data_path, write_to_pdf_file, template)
 
+    async def watch_pdf(
+        self,
+        cv_data_path: str,
+        output_path: str,
+        template: ResumeTemplate,
+        debounce_ms: int = 300,
+        on_pdf_written: Optional[PdfWrittenCallback] = None,
+        on_error: Optional[WatchErrorCallback] = None,
+    ) -> None:
+        """Keeps the PDF at output_path up to date with the source file, reusing this service's renderer.
+
+        Changes within debounce_ms of each other are handled together, and the PDF is only generated again
+        when the rendered HTML differs from the previous render. While the source file is invalid, or when
+        generating or writing the PDF fails, the last good PDF is kept and the error is passed to on_error.
+        """
+        last_rendered_content: Optional[str] = None
+
+        async def report_error(error_message: str) -> None:
+            if on_error is not None:
+                await on_error(error_message)
+
+        async def build_if_changed() -> None:
+            nonlocal last_rendered_content
+            try:
+                rendered_content = self._render_valid(cv_data_path, template)
+                if rendered_content == last_rendered_content:
+                    logger.info("Rendered HTML of %s did not change, skipping PDF generation", cv_data_path)
+                    return
+                pdf = await asyncio.to_thread(self._renderer.generate_pdf, rendered_content)
+                _write_atomically(output_path, pdf)
+            except InvalidResumeError as e:
+                await report_error(str(e))
+                return
+            except Exception as e:
+                logger.debug("Failed to build %s", output_path, exc_info=True)
+                await report_error(f"Could not build {output_path}: {e}")
+                return
+
+            last_rendered_content = rendered_content
+            if on_pdf_written is not None:
+                await on_pdf_written(output_path)
+
+        await build_if_changed()
+        async for _ in awatch(cv_data_path, debounce=debounce_ms):
+            await build_if_changed()
+
+    async def generate_pdfs(
+        self,
+        output_paths: Dict[str, str],
+        template: ResumeTemplate,
+        concurrency: int = 1,
+        on_resume_built: Optional[ResumeBuiltCallback] = None,
+    ) -> Dict[str, str]:
+        """Generates a PDF for each source file in output_paths, with at most `concurrency` PDFs at a time.
+
+        Unreadable or invalid source files get no PDF, and their errors are returned by source path. Other errors
+        are raised once all PDFs are done, so that on_resume_built has been called for every PDF that was written.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        errors: Dict[str, str] = {}
+
+        async def generate_one(cv_data_path: str, output_path: str) -> None:
+            async with semaphore:
+                try:
+                    rendered_content = self._render_valid(cv_data_path, template)
+                except InvalidResumeError as e:
+                    errors[cv_data_path] = str(e)
+                    return
+                pdf = await asyncio.to_thread(self._renderer.generate_pdf, rendered_content)
+                _write_atomically(output_path, pdf)
+            if on_resume_built is not None:
+                await on_resume_built(cv_data_path, output_path)
+
+        results = await asyncio.gather(
+            *(generate_one(source, output) for source, output in output_paths.items()), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return errors
+
+    async def generate_bundle(
+        self,
+        cv_data_paths: Sequence[str],
+        output_path: str,
+        template: ResumeTemplate,
+        concurrency: int = 1,
+        bookmarks: bool = True,
+    ) -> None:
+        """Generates one PDF with all resumes, with at most `concurrency` PDFs generated at a time.
+
+        Source files are all validated first, and nothing is written if any of them is unreadable or invalid.
+        PDFs are generated by the renderer, in worker processes with a PooledResumeRenderer, and appended to the
+        bundle in order as they complete, so at most `concurrency` resume PDFs wait to be appended.
+        """
+        rendered_contents: List[str] = []
+        errors: List[str] = []
+        for cv_data_path in cv_data_paths:
+            try:
+                rendered_contents.append(self._render_valid(cv_data_path, template))
+            except InvalidResumeError as e:
+                errors.append(f"{cv_data_path}: {e}")
+        if errors:
+            raise InvalidResumeError("\n".join(errors))
+
+        bundle = PdfBundle(bookmarks=bookmarks)
+        pending: Deque[Tuple[str, "asyncio.Task[bytes]"]] = deque()
+
+        async def append_next() -> None:
+            cv_data_path, generating = pending.popleft()
+            pdf = await generating
+            await asyncio.to_thread(bundle.append, pdf, Path(cv_data_path).stem)
+
+        try:
+            for cv_data_path, rendered_content in zip(cv_data_paths, rendered_contents):
+                if len(pending) >= concurrency:
+                    await append_next()
+                generating = asyncio.create_task(asyncio.to_thread(self._renderer.generate_pdf, rendered_content))
+                pending.append((cv_data_path, generating))
+            while pending:
+                await append_next()
+        finally:
+            for _, generating in pending:
+                generating.cancel()
+
+        def write_bundle() -> None:
+            with _open_atomically(output_path) as f:
+                bundle.write(f)
+
+        await asyncio.to_thread(write_bundle)
+
+    async def check(
+        self,
+        cv_data_path: str,
+        template: ResumeTemplate,
+        max_pages: Optional[int] = None,
+    ) -> ResumeCheckResult:
+        try:
+            rendered_content = self._render_valid(cv_data_path, template)
+        except InvalidResumeError as e:
+            return ResumeCheckResult(errors=[str(e)], warnings=[])
+
+        laid_out_resume = await asyncio.to_thread(self._renderer.lay_out, rendered_content)
+        return ResumeCheckResult(
+            errors=[],
+            warnings=laid_out_resume.overflow_warnings(max_pages),
+            laid_out_resume=laid_out_resume,
+        )
+
     async def show_previews(
         self,
         file_path: str,
         on_preview_updated: PreviewUpdatedCallback,
         template: ResumeTemplate,
     ) -> None:
-        await self._update_preview(file_path, on_preview_updated, template)
+        showing_error_page = await self._update_preview(file_path, on_preview_updated, template)
         async for _ in awatch(file_path):
-            await self._update_preview(file_path, on_preview_updated, template)
+            showing_error_page = await self._update_preview(
+                file_path, on_preview_updated, template, showing_error_page=showing_error_page
+            )
 
     @staticmethod
     def create_new_resume(output_path: str) -> NewResumeResult:
@@ -62,23 +244,81 @@ class ResumeService:
 
         return NewResumeResult(resume_path=output_path, schema_path=schema_dest)
 
+    def _render_valid(self, cv_data_path: str, template: ResumeTemplate) -> str:
+        """Renders the resume, or raises InvalidResumeError instead of rendering an error page."""
+        try:
+            with open(cv_data_path, "r") as f:
+                resume_data = yaml.safe_load(f)
+        except Exception as e:
+            raise InvalidResumeError(f"Could not open file: {cv_data_path}") from e
+
+        try:
+            return self._renderer.render_resume(resume_data, template)
+        except ResumeDataValidationError as e:
+            raise InvalidResumeError(str(e)) from e
+
     async def _update_preview(
         self,
         file_path: str,
         on_preview_updated: PreviewUpdatedCallback,
         template: ResumeTemplate,
-    ) -> None:
+        showing_error_page: bool = False,
+    ) -> bool:
+        """Sends the latest preview and returns whether it was an error page.
+
+        When an error page is already being shown, only the error details are sent, prefixed with
+        ERROR_DETAILS_MESSAGE_PREFIX, so that the schema reference is not rendered and sent again.
+        """
         try:
             with open(file_path, "r") as f:
                 resume_data = yaml.safe_load(f)
         except Exception:
-            await on_preview_updated(self._renderer.render_error(f"Could not open file: {file_path}"))
-            return
+            await self._show_error(f"Could not open file: {file_path}", on_preview_updated, showing_error_page)
+            return True
 
         try:
             rendered_content = self._renderer.render_resume(resume_data, template)
 
             await on_preview_updated(rendered_content)
+            return False
         except ResumeDataValidationError as e:
-            error_page = self._renderer.render_error(str(e))
-            await on_preview_updated(error_page)
+            await self._show_error(str(e), on_preview_updated, showing_error_page)
+            return True
+
+    async def _show_error(
+        self,
+        error_message: str,
+        on_preview_updated: PreviewUpdatedCallback,
+        showing_error_page: bool,
+    ) -> None:
+        if showing_error_page:
+            error_details = self._renderer.render_error_details(error_message)
+            await on_preview_updated(ERROR_DETAILS_MESSAGE_PREFIX + error_details)
+        else:
+            await on_preview_updated(self._renderer.render_error(error_message))
+
+
+@contextmanager
+def _open_atomically(output_path: str) -> Iterator[BinaryIO]:
+    """Opens a temporary file next to output_path and moves it over once written, so readers never see a partial file.
+
+    The temporary file is removed instead if the block raises.
+    """
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    f = tempfile.NamedTemporaryFile(dir=output_dir, prefix=".resumecli-", suffix=".tmp", delete=False)
+    try:
+        with f:
+            yield f
+        # Temporary files are only readable by their owner, give the output the permissions open() would.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(f.name, 0o666 & ~umask)
+        os.replace(f.name, output_path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+
+
+def _write_atomically(output_path: str, content: bytes) -> None:
+    with _open_atomically(output_path) as f:
+        f.write(content)
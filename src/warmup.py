@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from src.constants import PROJECT_ROOT
+from src.fonts import ENV_KEY_FONT_CACHE_DIR
+from src.renderer import ResumeTemplate
+
+SAMPLE_RESUME_PATH = PROJECT_ROOT / "cv.sample.yaml"
+
+
+@dataclass
+class WarmUpResult:
+    """Latencies of the first PDF of a new resumecli process, from start to exit, with each font configuration."""
+
+    system_fonts_first_pdf_seconds: float
+    template_fonts_first_pdf_seconds: float
+
+
+def warm_up(template: ResumeTemplate, font_cache_dir: Path) -> WarmUpResult:
+    """Builds the template font cache in font_cache_dir and measures the first PDF with and without it.
+
+    The process using the system fonts runs first, so that on a fresh machine it pays the cold start that the
+    template font cache avoids. The template font cache is built by a first process and measured with a second one.
+    """
+    system_fonts_seconds = measure_first_pdf_seconds(template, font_cache_dir=None)
+    measure_first_pdf_seconds(template, font_cache_dir=font_cache_dir)
+    template_fonts_seconds = measure_first_pdf_seconds(template, font_cache_dir=font_cache_dir)
+    return WarmUpResult(
+        system_fonts_first_pdf_seconds=system_fonts_seconds,
+        template_fonts_first_pdf_seconds=template_fonts_seconds,
+    )
+
+
+def measure_first_pdf_seconds(template: ResumeTemplate, font_cache_dir: Optional[Path]) -> float:
+    """Times building the sample resume in a new resumecli process, including imports and font loading.
+
+    The process uses the system fonts when font_cache_dir is None, and only the template fonts otherwise.
+    """
+    env = {key: value for key, value in os.environ.items() if key not in (ENV_KEY_FONT_CACHE_DIR, "FONTCONFIG_FILE")}
+    if font_cache_dir is not None:
+        env[ENV_KEY_FONT_CACHE_DIR] = str(font_cache_dir.resolve())
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        command = [
+            *_resumecli_command(),
+            "build",
+            str(SAMPLE_RESUME_PATH),
+            "--output",
+            os.path.join(temp_dir, "warmup.pdf"),
+            "--template",
+            template.value,
+        ]
+        started_at = time.perf_counter()
+        subprocess.run(command, env=env, cwd=PROJECT_ROOT, check=True, capture_output=True, text=True)
+        return time.perf_counter() - started_at
+
+
+def _resumecli_command() -> List[str]:
+    # In the PyInstaller binary, sys.executable is resumecli itself.
+    if getattr(sys, "frozen", False):
+        return [sys.executable]
+    return [sys.executable, "-m", "src.cli"]
@@ -0,0 +1,178 @@
+import logging
+import multiprocessing
+import os
+import queue
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from types import TracebackType
+from typing import Optional, Type, Union
+
+from src.memory import get_peak_rss_bytes, get_rss_bytes, reset_peak_rss
+from src.renderer import ResumeRenderer
+
+logger = logging.getLogger(__name__)
+
+_WORKER_STOP_TIMEOUT_SECONDS = 10.0
+
+
+class RenderWorkerCrashedError(Exception):
+    def __init__(self, pid: Optional[int]):
+        super().__init__(f"Render worker {pid} exited while rendering a PDF")
+
+
+@dataclass
+class RenderJobResult:
+    pdf: bytes
+    peak_rss_bytes: Optional[int]
+    rss_bytes: Optional[int]
+
+
+def _serve_render_jobs(connection: Connection) -> None:
+    renderer = ResumeRenderer()
+    while True:
+        rendered_resume = connection.recv()
+        if rendered_resume is None:
+            return
+
+        reset_peak_rss()
+        response: Union[RenderJobResult, Exception]
+        try:
+            pdf = renderer.generate_pdf(rendered_resume)
+            response = RenderJobResult(
+                pdf=pdf, peak_rss_bytes=get_peak_rss_bytes(), rss_bytes=get_rss_bytes(os.getpid())
+            )
+        except Exception as e:
+            response = e
+        connection.send(response)
+
+
+class _RenderWorker:
+    def __init__(self, context: BaseContext):
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(target=_serve_render_jobs, args=(child_connection,), daemon=True)
+        self._process.start()
+        child_connection.close()
+        self.jobs_done = 0
+        self.rss_bytes: Optional[int] = None
+        self._crashed = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    def is_alive(self) -> bool:
+        return not self._crashed and self._process.is_alive()
+
+    def generate_pdf(self, rendered_resume: str) -> RenderJobResult:
+        try:
+            self._connection.send(rendered_resume)
+            response = self._connection.recv()
+        except (EOFError, OSError) as e:
+            self._crashed = True
+            raise RenderWorkerCrashedError(self.pid) from e
+        finally:
+            self.jobs_done += 1
+
+        if isinstance(response, Exception):
+            raise response
+        self.rss_bytes = response.rss_bytes
+        return response
+
+    def stop(self) -> None:
+        try:
+            self._connection.send(None)
+        except OSError:
+            pass
+        self._process.join(_WORKER_STOP_TIMEOUT_SECONDS)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._connection.close()
+
+
+class RenderWorkerPool:
+    """Generates PDFs in worker processes that are recycled to keep memory usage flat.
+
+    WeasyPrint and Pango do not give all memory back after a render, so a long-lived process that renders
+    many PDFs keeps growing. A worker is replaced after max_jobs_per_worker renders, or as soon as its
+    resident set size goes over max_worker_rss_bytes. Workers are started lazily and the pool is safe to
+    use from several threads, with at most `workers` renders running at a time.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        max_jobs_per_worker: int = 100,
+        max_worker_rss_bytes: Optional[int] = None,
+    ):
+        if workers < 1:
+            raise ValueError(f"A render worker pool needs at least one worker, got {workers}")
+        self._context = multiprocessing.get_context("spawn")
+        self._max_jobs_per_worker = max_jobs_per_worker
+        self._max_worker_rss_bytes = max_worker_rss_bytes
+        self._idle_workers: "queue.Queue[Optional[_RenderWorker]]" = queue.Queue()
+        for _ in range(workers):
+            self._idle_workers.put(None)
+        self._workers = workers
+
+    def generate_pdf(self, rendered_resume: str) -> bytes:
+        worker = self._idle_workers.get()
+        try:
+            worker = worker or _RenderWorker(self._context)
+            result = worker.generate_pdf(rendered_resume)
+        finally:
+            # The slot goes back to the pool even when starting a worker failed, otherwise close() would block.
+            self._idle_workers.put(self._recycle_if_needed(worker))
+
+        logger.info(
+            "Rendered PDF in worker %s: peak RSS %s bytes, RSS after render %s bytes",
+            worker.pid,
+            result.peak_rss_bytes,
+            result.rss_bytes,
+        )
+        return result.pdf
+
+    def close(self) -> None:
+        for _ in range(self._workers):
+            worker = self._idle_workers.get()
+            if worker is not None:
+                worker.stop()
+
+    def __enter__(self) -> "RenderWorkerPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _recycle_if_needed(self, worker: Optional[_RenderWorker]) -> Optional[_RenderWorker]:
+        if worker is None:
+            return None
+        if not worker.is_alive():
+            reason = "it exited"
+        elif worker.jobs_done >= self._max_jobs_per_worker:
+            reason = f"it completed {worker.jobs_done} jobs"
+        elif self._max_worker_rss_bytes is not None and (worker.rss_bytes or 0) > self._max_worker_rss_bytes:
+            reason = f"its RSS of {worker.rss_bytes} bytes is over {self._max_worker_rss_bytes} bytes"
+        else:
+            return worker
+
+        logger.info("Recycling render worker %s because %s", worker.pid, reason)
+        worker.stop()
+        return None
+
+
+class PooledResumeRenderer(ResumeRenderer):
+    """A ResumeRenderer that generates PDFs in the supervised worker processes of a RenderWorkerPool."""
+
+    def __init__(self, worker_pool: RenderWorkerPool, max_validation_errors: int = 10) -> None:
+        super().__init__(max_validation_errors=max_validation_errors)
+        self._worker_pool = worker_pool
+
+    def generate_pdf(self, rendered_resume: str) -> bytes:
+        return self._worker_pool.generate_pdf(rendered_resume)
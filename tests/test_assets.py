@@ -0,0 +1,161 @@
+import asyncio
+from typing import Optional
+from unittest.mock import patch
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.assets import (
+    STATIC_ASSETS_DIR,
+    PrecompressedStaticFiles,
+    StaticAsset,
+    StaticAssetStore,
+    TemplateAssetFetcher,
+)
+from src.constants import PROJECT_ROOT
+
+CSS_PATH = "css/fontawesome/fontawesome-free-6.4.0-web/css/all.min.css"
+WOFF2_PATH = "css/fontawesome/fontawesome-free-6.4.0-web/webfonts/fa-solid-900.woff2"
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.mount("/static", PrecompressedStaticFiles(), name="static")
+    return TestClient(app)
+
+
+def read_static_asset(relative_path: str) -> bytes:
+    return (STATIC_ASSETS_DIR / relative_path).read_bytes()
+
+
+class TestPrecompressedStaticFiles:
+    def test_serves_brotli_variant_when_accepted(self, client: TestClient) -> None:
+        response = client.get(f"/static/{CSS_PATH}", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.content == read_static_asset(CSS_PATH)
+
+    def test_serves_gzip_variant_when_brotli_is_not_accepted(self, client: TestClient) -> None:
+        response = client.get(f"/static/{CSS_PATH}", headers={"Accept-Encoding": "gzip, br;q=0"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == read_static_asset(CSS_PATH)
+
+    def test_serves_identity_when_no_encoding_is_accepted(self, client: TestClient) -> None:
+        response = client.get(f"/static/{CSS_PATH}", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.content == read_static_asset(CSS_PATH)
+
+    def test_does_not_compress_already_compressed_fonts(self, client: TestClient) -> None:
+        response = client.get(f"/static/{WOFF2_PATH}", headers={"Accept-Encoding": "gzip, br"})
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-type"] == "font/woff2"
+
+    def test_sends_strong_etag_and_immutable_cache_headers(self, client: TestClient) -> None:
+        brotli_response = client.get(f"/static/{CSS_PATH}", headers={"Accept-Encoding": "br"})
+        identity_response = client.get(f"/static/{CSS_PATH}", headers={"Accept-Encoding": "identity"})
+
+        assert brotli_response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert not brotli_response.headers["etag"].startswith("W/")
+        assert brotli_response.headers["etag"] != identity_response.headers["etag"]
+
+    def test_not_modified_when_etag_matches(self, client: TestClient) -> None:
+        etag = client.get(f"/static/{CSS_PATH}", headers={"Accept-Encoding": "br"}).headers["etag"]
+
+        response = client.get(f"/static/{CSS_PATH}", headers={"Accept-Encoding": "br", "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_missing_asset(self, client: TestClient) -> None:
+        assert client.get("/static/does/not/exist.css").status_code == 404
+
+    def test_assets_are_loaded_off_the_event_loop(self, client: TestClient) -> None:
+        loaded_on_event_loop = []
+        original_get = StaticAssetStore.get
+
+        def recording_get(store: StaticAssetStore, relative_path: str) -> Optional[StaticAsset]:
+            try:
+                asyncio.get_running_loop()
+                loaded_on_event_loop.append(True)
+            except RuntimeError:
+                loaded_on_event_loop.append(False)
+            return original_get(store, relative_path)
+
+        with patch.object(StaticAssetStore, "get", recording_get):
+            response = client.get(f"/static/{CSS_PATH}", headers={"Accept-Encoding": "br"})
+
+        assert response.status_code == 200
+        assert loaded_on_event_loop == [False]
+
+
+class TestStaticAssetStore:
+    def test_assets_are_loaded_once(self) -> None:
+        store = StaticAssetStore()
+
+        assert store.get(CSS_PATH) is store.get(CSS_PATH)
+
+    def test_precompressed_variants_match_content(self) -> None:
+        asset = StaticAssetStore().get(CSS_PATH)
+
+        assert asset is not None
+        assert brotli.decompress(asset.encoded["br"]) == asset.content
+
+    def test_least_recently_used_assets_are_evicted(self) -> None:
+        store = StaticAssetStore(max_cached_bytes=1)
+        first = store.get(CSS_PATH)
+        store.get(WOFF2_PATH)
+
+        assert store.get(CSS_PATH) is not first
+
+    def test_paths_outside_the_directory_are_not_served(self) -> None:
+        assert StaticAssetStore().get("../error.html") is None
+
+
+class TestTemplateAssetFetcher:
+    def test_serves_template_assets_from_memory(self) -> None:
+        fetcher = TemplateAssetFetcher(StaticAssetStore(precompress=False))
+
+        result = fetcher((STATIC_ASSETS_DIR / CSS_PATH).as_uri())
+
+        assert result["string"] == read_static_asset(CSS_PATH)
+        assert result["mime_type"] == "text/css"
+        assert fetcher.used_assets == {CSS_PATH}
+
+    def test_resolves_relative_segments_inside_the_asset_directory(self) -> None:
+        fetcher = TemplateAssetFetcher(StaticAssetStore(precompress=False))
+        css_dir_url = (STATIC_ASSETS_DIR / CSS_PATH).parent.as_uri()
+
+        fetcher(f"{css_dir_url}/../webfonts/fa-solid-900.woff2")
+
+        assert fetcher.used_assets == {WOFF2_PATH}
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            (PROJECT_ROOT / "cv.schema.json").as_uri(),
+            (STATIC_ASSETS_DIR / ".." / "error.html").as_uri(),
+            "https://example.com/font.woff2",
+        ],
+    )
+    def test_rejects_urls_outside_the_whitelist(self, url: str) -> None:
+        fetcher = TemplateAssetFetcher(StaticAssetStore(precompress=False))
+
+        with pytest.raises(ValueError):
+            fetcher(url)
+
+        assert fetcher.used_assets == set()
+
+    def test_assets_are_not_precompressed_for_rendering(self) -> None:
+        asset = StaticAssetStore(precompress=False).get(CSS_PATH)
+
+        assert asset is not None
+        assert asset.encoded == {}
@@ -0,0 +1,108 @@
+from typing import Dict
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner, Result
+
+from src.cli import app
+from src.manifest import BuildManifest, Shard, hash_file
+
+SOURCE_PATHS = [f"r{i}.yaml" for i in range(8)]
+
+
+class FakeResumeService:
+    """Builds each resume into a PDF that only depends on its source, without rendering it.
+
+    Sources containing "invalid" are reported as invalid, and sources containing "crash" make the build raise.
+    """
+
+    def __init__(self, renderer):
+        pass
+
+    async def generate_pdfs(
+        self, output_paths: Dict[str, str], template, concurrency=1, on_resume_built=None
+    ) -> Dict[str, str]:
+        errors = {}
+        crashed = False
+        for cv_data_path, output_path in output_paths.items():
+            with open(cv_data_path, "rb") as source:
+                content = source.read()
+            if b"invalid" in content:
+                errors[cv_data_path] = "Failed to validate resume data: 'name' is a required property"
+                continue
+            if b"crash" in content:
+                crashed = True
+                continue
+            with open(output_path, "wb") as output:
+                output.write(b"PDF:" + content)
+            await on_resume_built(cv_data_path, output_path)
+        if crashed:
+            raise RuntimeError("Render worker crashed")
+        return errors
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for source_path in SOURCE_PATHS:
+        (tmp_path / source_path).write_text(f"name: {source_path}\n")
+    with patch("src.cli.ResumeService", FakeResumeService):
+        yield tmp_path
+
+
+def run(*args: str, exit_code: int = 0) -> Result:
+    result = CliRunner().invoke(app, list(args))
+    assert result.exit_code == exit_code, result.output
+    return result
+
+
+def build_shards(*extra_args: str) -> None:
+    for index in (1, 2):
+        run("build", *SOURCE_PATHS, "--output-dir", "out", "--shard", f"{index}/2", *extra_args)
+
+
+def test_sharded_builds_can_be_merged_again_after_a_rebuild(corpus):
+    shards = [Shard(1, 2), Shard(2, 2)]
+    shard_manifests = [f"out/{shard.manifest_name()}" for shard in shards]
+    build_shards()
+    run("merge-manifests", *shard_manifests, "--output", "merged.json")
+
+    changed_sources = [next(path for path in SOURCE_PATHS if shard.contains(path)) for shard in shards]
+    for source_path in changed_sources:
+        (corpus / source_path).write_text(f"name: {source_path}\nchanged: true\n")
+    build_shards("--manifest", "merged.json")
+    run("merge-manifests", *shard_manifests, "--output", "merged.json")
+
+    merged = BuildManifest.load("merged.json")
+    assert sorted(merged.entries) == SOURCE_PATHS
+    for source_path in SOURCE_PATHS:
+        assert merged.entries[source_path].input_hash == hash_file(source_path)
+    for shard, manifest_path in zip(shards, shard_manifests):
+        assert all(shard.contains(source_path) for source_path in BuildManifest.load(manifest_path).entries)
+
+
+def test_invalid_resumes_fail_the_build_and_are_not_recorded(corpus):
+    (corpus / "r1.yaml").write_text("invalid: true\n")
+
+    result = run("build", *SOURCE_PATHS, "--output-dir", "out", exit_code=1)
+
+    assert "r1.yaml: Failed to validate resume data" in result.output
+    assert not (corpus / "out" / "r1.pdf").exists()
+    manifest = BuildManifest.load("out/resumecli-manifest.json")
+    assert sorted(manifest.entries) == [path for path in SOURCE_PATHS if path != "r1.yaml"]
+
+
+def test_built_resumes_are_recorded_when_the_build_fails(corpus):
+    (corpus / "r1.yaml").write_text("crash: true\n")
+
+    result = run("build", *SOURCE_PATHS, "--output-dir", "out", exit_code=1)
+
+    assert isinstance(result.exception, RuntimeError)
+    manifest = BuildManifest.load("out/resumecli-manifest.json")
+    assert sorted(manifest.entries) == [path for path in SOURCE_PATHS if path != "r1.yaml"]
+
+
+def test_check_rejects_a_page_limit_below_one(corpus):
+    result = run("check", "r0.yaml", "--max-pages", "0", exit_code=2)
+
+    assert "--max-pages" in result.output
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+from xml.etree import ElementTree
+
+from src.constants import PROJECT_ROOT
+from src.fonts import (
+    TEMPLATE_FONT_DIRS,
+    configured_font_cache_dir,
+    render_fontconfig,
+    use_configured_template_fonts,
+    use_template_fonts,
+)
+
+
+def test_template_font_dirs_contain_fonts():
+    for font_dir in TEMPLATE_FONT_DIRS:
+        assert any(path.suffix == ".ttf" for path in font_dir.iterdir())
+
+
+def test_render_fontconfig_only_lists_template_fonts():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config = ElementTree.fromstring(render_fontconfig(Path(cache_dir)))
+
+    assert [element.text for element in config.findall("dir")] == [str(d.resolve()) for d in TEMPLATE_FONT_DIRS]
+    assert [element.text for element in config.findall("cachedir")] == [str(Path(cache_dir).resolve())]
+    assert config.find("include") is None
+    assert {element.findtext("family") for element in config.findall("alias")} == {"sans-serif", "serif", "monospace"}
+
+
+def test_render_fontconfig_escapes_paths():
+    config = ElementTree.fromstring(render_fontconfig(Path("/tmp/fonts & <cache>")))
+
+    assert config.findtext("cachedir") == "/tmp/fonts & <cache>"
+
+
+def test_use_template_fonts():
+    with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.dict(os.environ):
+        cache_dir = Path(tmp_dir) / "fontconfig"
+
+        config_path = use_template_fonts(cache_dir)
+        modified_at = config_path.stat().st_mtime_ns
+        use_template_fonts(cache_dir)
+
+        assert os.environ["FONTCONFIG_FILE"] == str(config_path)
+        assert config_path.read_text() == render_fontconfig(cache_dir)
+        assert config_path.stat().st_mtime_ns == modified_at
+
+
+def test_use_configured_template_fonts_falls_back_to_system_fonts(caplog):
+    with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.dict(os.environ):
+        not_a_dir = Path(tmp_dir) / "file"
+        not_a_dir.write_text("")
+        os.environ["RESUMECLI_FONT_CACHE_DIR"] = str(not_a_dir / "fontconfig")
+        os.environ.pop("FONTCONFIG_FILE", None)
+
+        use_configured_template_fonts()
+
+        assert "FONTCONFIG_FILE" not in os.environ
+    assert "using the system fonts" in caplog.text
+
+
+def test_configured_font_cache_dir():
+    with mock.patch.dict(os.environ, {"RESUMECLI_FONT_CACHE_DIR": "/tmp/resumecli-fonts"}):
+        assert configured_font_cache_dir() == Path("/tmp/resumecli-fonts")
+    with mock.patch.dict(os.environ, {"RESUMECLI_FONT_CACHE_DIR": ""}):
+        assert configured_font_cache_dir() is None
+
+
+def test_template_fonts_are_configured_before_weasyprint_is_imported():
+    check_import = (
+        "import os, sys, src; assert 'weasyprint' not in sys.modules; print(os.environ.get('FONTCONFIG_FILE'))"
+    )
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = {**os.environ, "RESUMECLI_FONT_CACHE_DIR": cache_dir}
+        env.pop("FONTCONFIG_FILE", None)
+        result = subprocess.run(
+            [sys.executable, "-c", check_import], env=env, cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == str(Path(cache_dir) / "fonts.conf")
+        assert (Path(cache_dir) / "fonts.conf").is_file()
@@ -0,0 +1,56 @@
+import json
+import tempfile
+
+import pytest
+
+from src.loadtest import LatencySummary, LoadTestReport, percentile
+
+
+@pytest.mark.parametrize(
+    "values, percent, expected",
+    [
+        ([], 50, None),
+        ([7.0], 99, 7.0),
+        ([1.0, 2.0, 3.0, 4.0], 50, 2.5),
+        ([4.0, 1.0, 3.0, 2.0], 0, 1.0),
+        ([4.0, 1.0, 3.0, 2.0], 100, 4.0),
+        (list(range(1, 101)), 95, 95.05),
+    ],
+)
+def test_percentile(values, percent, expected):
+    assert percentile(values, percent) == pytest.approx(expected)
+
+
+def test_latency_summary_from_latencies():
+    summary = LatencySummary.from_latencies([10.0, 20.0, 30.0])
+
+    assert summary.count == 3
+    assert summary.p50_ms == 20.0
+    assert summary.max_ms == 30.0
+
+
+def test_latency_summary_without_latencies():
+    summary = LatencySummary.from_latencies([])
+
+    assert summary == LatencySummary(count=0, p50_ms=None, p95_ms=None, p99_ms=None, max_ms=None)
+
+
+def test_report_is_written_as_json():
+    report = LoadTestReport(
+        config={"sessions": 2},
+        edits=4,
+        updates=6,
+        elapsed_seconds=3.0,
+        throughput_updates_per_second=2.0,
+        time_to_update=LatencySummary.from_latencies([100.0, 200.0]),
+        server_rss_bytes={"start": 1, "end": 3, "peak": 4},
+    )
+
+    with tempfile.NamedTemporaryFile(suffix=".json") as report_file:
+        report.write(report_file.name)
+        with open(report_file.name, "r") as f:
+            written = json.load(f)
+
+    assert written["updates"] == 6
+    assert written["time_to_update"]["p50_ms"] == 150.0
+    assert written["server_rss_bytes"]["peak"] == 4
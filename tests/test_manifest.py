@@ -0,0 +1,97 @@
+import os
+import tempfile
+
+import pytest
+
+from src.manifest import BuildManifest, ManifestConflictError, ManifestEntry, Shard, hash_file
+
+SOURCE_PATHS = [f"resumes/team-{team}/candidate-{i}.yaml" for team in range(3) for i in range(20)]
+
+
+class TestShard:
+    @pytest.mark.parametrize("value, expected", [("1/1", Shard(1, 1)), ("2/4", Shard(2, 4)), ("4/4", Shard(4, 4))])
+    def test_parse(self, value, expected):
+        assert Shard.parse(value) == expected
+
+    @pytest.mark.parametrize("value", ["", "2", "0/4", "5/4", "a/4", "-1/4"])
+    def test_parse_invalid(self, value):
+        with pytest.raises(ValueError):
+            Shard.parse(value)
+
+    def test_shards_partition_source_paths(self):
+        shards = [Shard(i, 4) for i in range(1, 5)]
+
+        for source_path in SOURCE_PATHS:
+            assert sum(shard.contains(source_path) for shard in shards) == 1
+
+        assert all(any(shard.contains(source_path) for source_path in SOURCE_PATHS) for shard in shards)
+
+    def test_equivalent_paths_are_in_the_same_shard(self):
+        shards = [Shard(i, 4) for i in range(1, 5)]
+
+        for shard in shards:
+            assert shard.contains("./resumes/a.yaml") == shard.contains("resumes/a.yaml")
+
+
+class TestBuildManifest:
+    def test_missing_manifest_is_empty(self):
+        assert BuildManifest.load("/path/that/does/not/exist.json") == BuildManifest()
+
+    def test_save_and_load(self):
+        manifest = BuildManifest(entries={"a.yaml": ManifestEntry("in", "template", "out", "a.pdf")})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manifest_path = os.path.join(temp_dir, "manifest.json")
+            manifest.save(manifest_path)
+
+            assert BuildManifest.load(manifest_path) == manifest
+
+    def test_is_up_to_date(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "a.pdf")
+            with open(output_path, "wb") as f:
+                f.write(b"PDF_CONTENT")
+
+            manifest = BuildManifest()
+            manifest.record("./a.yaml", output_path, "input-hash", "template-hash")
+
+            assert manifest.entries["a.yaml"].output_hash == hash_file(output_path)
+            assert manifest.is_up_to_date("a.yaml", output_path, "input-hash", "template-hash")
+            assert not manifest.is_up_to_date("a.yaml", output_path, "changed-input-hash", "template-hash")
+            assert not manifest.is_up_to_date("a.yaml", output_path, "input-hash", "changed-template-hash")
+            assert not manifest.is_up_to_date("a.yaml", output_path, None, "template-hash")
+            assert not manifest.is_up_to_date("b.yaml", output_path, "input-hash", "template-hash")
+
+            with open(output_path, "wb") as f:
+                f.write(b"MODIFIED_PDF_CONTENT")
+            assert not manifest.is_up_to_date("a.yaml", output_path, "input-hash", "template-hash")
+
+            os.unlink(output_path)
+            assert not manifest.is_up_to_date("a.yaml", output_path, "input-hash", "template-hash")
+
+    def test_merge(self):
+        first = BuildManifest(entries={"a.yaml": ManifestEntry("a", "t", "a-out", "a.pdf")})
+        second = BuildManifest(entries={"b.yaml": ManifestEntry("b", "t", "b-out", "b.pdf")})
+
+        merged = BuildManifest.merge([first, second, first])
+
+        assert merged.entries == {**first.entries, **second.entries}
+
+    def test_for_shard(self):
+        shard = Shard(1, 2)
+        manifest = BuildManifest(
+            entries={source: ManifestEntry("in", "t", "out", f"{source}.pdf") for source in SOURCE_PATHS}
+        )
+
+        shard_manifest = manifest.for_shard(shard)
+
+        assert shard_manifest.entries
+        assert all(shard.contains(source) for source in shard_manifest.entries)
+        assert BuildManifest.merge([shard_manifest, manifest.for_shard(Shard(2, 2))]) == manifest
+
+    def test_merge_conflict(self):
+        first = BuildManifest(entries={"a.yaml": ManifestEntry("a", "t", "a-out", "a.pdf")})
+        second = BuildManifest(entries={"a.yaml": ManifestEntry("changed", "t", "a-out", "a.pdf")})
+
+        with pytest.raises(ManifestConflictError):
+            BuildManifest.merge([first, second])
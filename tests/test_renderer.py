@@ -1,12 +1,13 @@
 import os
 from dataclasses import dataclass
 from typing import Any, Dict, List, cast
+from unittest.mock import MagicMock
 
 import pytest
 import yaml
 from bs4 import BeautifulSoup, Tag
 
-from src.renderer import ResumeRenderer, ResumeTemplate
+from src.renderer import LaidOutResume, ResumeDataValidationError, ResumeRenderer, ResumeTemplate
 
 
 @dataclass
@@ -178,3 +179,63 @@ class TestRenderer:
         soup = BeautifulSoup(rendered_html, "html.parser")
 
         assert error_message in soup.get_text(), "Error message not found in rendered HTML"
+
+    def test_lay_out(self, renderer: ResumeRenderer) -> None:
+        cv_data = load_sample_cv()
+
+        laid_out_resume = renderer.lay_out(renderer.render_resume(cv_data, ResumeTemplate.MINIMAL_BLUE))
+
+        assert laid_out_resume.page_count >= 1
+        assert laid_out_resume.title == f"{cv_data['name']} - Resume"
+        assert "fonts/Inter-Regular.ttf" in laid_out_resume.used_assets
+        assert laid_out_resume.write_pdf().startswith(b"%PDF")
+
+    def test_overflow_warnings(self) -> None:
+        pages = [MagicMock(bookmarks=[]) for _ in range(3)]
+        pages[2].bookmarks = [(2, "Education", (0, 0), "open"), (2, "Languages", (0, 400), "open")]
+        laid_out_resume = LaidOutResume(document=MagicMock(pages=pages), used_assets=frozenset())
+
+        assert laid_out_resume.overflow_warnings(max_pages=None) == []
+        assert laid_out_resume.overflow_warnings(max_pages=3) == []
+        assert laid_out_resume.overflow_warnings(max_pages=1) == [
+            "Resume has 3 pages, which is more than the limit of 1",
+            "Page 3 starts the sections: Education, Languages",
+        ]
+
+    def test_render_error_details(self, renderer: ResumeRenderer) -> None:
+        error_message = "Test error message"
+        rendered_html = renderer.render_error_details(error_message)
+
+        soup = BeautifulSoup(rendered_html, "html.parser")
+
+        assert soup.get_text().strip() == error_message
+        assert soup.find(id="error-details") is not None
+
+    def test_validation_collects_multiple_errors(self, renderer: ResumeRenderer) -> None:
+        cv_data = load_sample_cv()
+        del cv_data["name"]
+        cv_data["contact"]["email"] = 42
+
+        with pytest.raises(ResumeDataValidationError) as exc_info:
+            renderer.render_resume(cv_data, ResumeTemplate.MINIMAL_BLUE)
+
+        assert len(exc_info.value.causes) == 2
+        assert "'name' is a required property" in str(exc_info.value)
+        assert "$.contact.email: 42 is not of type 'string'" in str(exc_info.value)
+
+    def test_validation_errors_are_capped(self) -> None:
+        renderer = ResumeRenderer(max_validation_errors=1)
+        cv_data = load_sample_cv()
+        del cv_data["name"]
+        cv_data["contact"]["email"] = 42
+
+        with pytest.raises(ResumeDataValidationError) as exc_info:
+            renderer.render_resume(cv_data, ResumeTemplate.MINIMAL_BLUE)
+
+        assert len(exc_info.value.causes) == 1
+
+    def test_schema_is_loaded_once_for_all_renderers(self) -> None:
+        first, second = ResumeRenderer(), ResumeRenderer(max_validation_errors=1)
+
+        assert first._validator is second._validator
+        assert first._rendered_schema is second._rendered_schema
@@ -1,18 +1,23 @@
 import os
 import tempfile
+import time
+from io import BytesIO
 from pathlib import Path
+from typing import List, Optional
 from unittest.mock import MagicMock, call, patch
 
 import jsonschema.exceptions
 import pytest
 import yaml
+from pypdf import PdfReader, PdfWriter
 
 from src.constants import PROJECT_ROOT
-from src.renderer import ResumeDataValidationError, ResumeRenderer, ResumeTemplate
-from src.service import NewResumeResult, ResumeService
+from src.renderer import LaidOutResume, ResumeDataValidationError, ResumeRenderer, ResumeTemplate
+from src.service import ERROR_DETAILS_MESSAGE_PREFIX, InvalidResumeError, NewResumeResult, ResumeService
 
 SAMPLE_RENDERED_RESUME = "<html>Rendered Resume</html>"
 SAMPLE_RENDERED_ERROR = "<html>Error Page</html>"
+SAMPLE_RENDERED_ERROR_DETAILS = "<div>Error Details</div>"
 SAMPLE_PDF_BYTES = b"PDF_CONTENT"
 
 
@@ -21,15 +26,38 @@ def mock_renderer():
     renderer = MagicMock(spec=ResumeRenderer)
     renderer.render_resume.return_value = SAMPLE_RENDERED_RESUME
     renderer.render_error.return_value = SAMPLE_RENDERED_ERROR
+    renderer.render_error_details.return_value = SAMPLE_RENDERED_ERROR_DETAILS
     renderer.generate_pdf.return_value = SAMPLE_PDF_BYTES
     return renderer
 
 
+def make_pdf(pages: int, title: Optional[str] = None) -> bytes:
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=595, height=842)
+    if title is not None:
+        writer.add_metadata({"/Title": title})
+    writer.add_outline_item("Experience", 0)
+    output = BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def write_yaml_files(directory: str, names: List[str]) -> List[str]:
+    yaml_file_paths = []
+    for name in names:
+        yaml_file_path = os.path.join(directory, f"{name}.yaml")
+        with open(yaml_file_path, "w") as yaml_file:
+            yaml.dump({"name": name}, yaml_file)
+        yaml_file_paths.append(yaml_file_path)
+    return yaml_file_paths
+
+
 class FileChangeSimulator:
     def __init__(self, file_content_list):
         self._file_content_list = file_content_list
 
-    async def fake_awatch(self, file_path):
+    async def fake_awatch(self, file_path, **kwargs):
         for content in self._file_content_list:
             with open(file_path, "w") as f:
                 f.write(content)
@@ -76,6 +104,203 @@ class TestResumeService:
             os.unlink(yaml_file_path)
             os.unlink(pdf_file_path)
 
+    @pytest.mark.asyncio
+    async def test_generate_pdfs(self, resume_service, mock_renderer):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_paths = {}
+            for i in range(3):
+                yaml_file_path = os.path.join(temp_dir, f"cv{i}.yaml")
+                with open(yaml_file_path, "w") as yaml_file:
+                    yaml.dump({"v": i}, yaml_file)
+                output_paths[yaml_file_path] = os.path.join(temp_dir, f"cv{i}.pdf")
+
+            await resume_service.generate_pdfs(output_paths, template=ResumeTemplate.MINIMAL_BLUE, concurrency=2)
+
+            mock_renderer.render_resume.assert_has_calls(
+                [call({"v": i}, ResumeTemplate.MINIMAL_BLUE) for i in range(3)], any_order=True
+            )
+            for pdf_file_path in output_paths.values():
+                with open(pdf_file_path, "rb") as f:
+                    assert f.read() == SAMPLE_PDF_BYTES
+
+    @pytest.mark.asyncio
+    async def test_generate_pdfs_reports_invalid_resumes(self, resume_service, mock_renderer):
+        mock_renderer.render_resume.side_effect = [
+            SAMPLE_RENDERED_RESUME,
+            ResumeDataValidationError(jsonschema.exceptions.ValidationError("'name' is a required property")),
+        ]
+        built = []
+
+        async def on_resume_built(cv_data_path, output_path):
+            built.append((cv_data_path, output_path))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            valid_path, invalid_path = write_yaml_files(temp_dir, ["valid", "invalid"])
+            missing_path = os.path.join(temp_dir, "missing.yaml")
+            output_paths = {path: path.replace(".yaml", ".pdf") for path in [valid_path, invalid_path, missing_path]}
+
+            errors = await resume_service.generate_pdfs(
+                output_paths, template=ResumeTemplate.MINIMAL_BLUE, on_resume_built=on_resume_built
+            )
+
+            assert errors == {
+                invalid_path: "Failed to validate resume data: 'name' is a required property",
+                missing_path: f"Could not open file: {missing_path}",
+            }
+            assert built == [(valid_path, output_paths[valid_path])]
+            assert sorted(os.listdir(temp_dir)) == ["invalid.yaml", "valid.pdf", "valid.yaml"]
+        mock_renderer.render_error.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_pdfs_finishes_other_resumes_before_raising(self, resume_service, mock_renderer):
+        mock_renderer.generate_pdf.side_effect = [RuntimeError("Render worker crashed"), SAMPLE_PDF_BYTES]
+        built = []
+
+        async def on_resume_built(cv_data_path, output_path):
+            built.append(cv_data_path)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first_path, second_path = write_yaml_files(temp_dir, ["first", "second"])
+            output_paths = {path: path.replace(".yaml", ".pdf") for path in [first_path, second_path]}
+
+            with pytest.raises(RuntimeError):
+                await resume_service.generate_pdfs(
+                    output_paths, template=ResumeTemplate.MINIMAL_BLUE, on_resume_built=on_resume_built
+                )
+
+        assert built == [second_path]
+
+    @pytest.mark.asyncio
+    async def test_generate_bundle(self, resume_service, mock_renderer):
+        def generate_pdf(rendered_content: str) -> bytes:
+            name = rendered_content.split(":")[1]
+            if name == "first":
+                # Finishes after the second resume, which must still come second in the bundle.
+                time.sleep(0.1)
+            return make_pdf(pages=2 if name == "first" else 1, title="Jane Doe - Resume" if name == "first" else None)
+
+        mock_renderer.render_resume.side_effect = lambda resume_data, template: f"<html>:{resume_data['name']}:"
+        mock_renderer.generate_pdf.side_effect = generate_pdf
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file_paths = write_yaml_files(temp_dir, ["first", "second"])
+            pdf_file_path = os.path.join(temp_dir, "bundle.pdf")
+
+            await resume_service.generate_bundle(
+                yaml_file_paths, pdf_file_path, template=ResumeTemplate.MINIMAL_BLUE, concurrency=2
+            )
+
+            reader = PdfReader(pdf_file_path)
+            assert len(reader.pages) == 3
+            assert [(item.title, reader.get_destination_page_number(item)) for item in reader.outline] == [
+                ("Jane Doe - Resume", 0),
+                ("second", 2),
+            ]
+        assert mock_renderer.generate_pdf.call_count == 2
+        mock_renderer.render_error.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_bundle_without_bookmarks(self, resume_service, mock_renderer):
+        mock_renderer.generate_pdf.side_effect = lambda rendered_content: make_pdf(pages=1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file_paths = write_yaml_files(temp_dir, ["first", "second"])
+            pdf_file_path = os.path.join(temp_dir, "bundle.pdf")
+
+            await resume_service.generate_bundle(
+                yaml_file_paths, pdf_file_path, template=ResumeTemplate.MINIMAL_BLUE, bookmarks=False
+            )
+
+            reader = PdfReader(pdf_file_path)
+            assert len(reader.pages) == 2
+            assert reader.outline == []
+
+    @pytest.mark.asyncio
+    async def test_generate_bundle_write_error_leaves_no_file(self, resume_service, mock_renderer):
+        mock_renderer.generate_pdf.side_effect = lambda rendered_content: make_pdf(pages=1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file_paths = write_yaml_files(temp_dir, ["first"])
+            pdf_file_path = os.path.join(temp_dir, "bundle.pdf")
+
+            with patch("src.bundle.PdfWriter.write", side_effect=OSError("No space left on device")):
+                with pytest.raises(OSError):
+                    await resume_service.generate_bundle(
+                        yaml_file_paths, pdf_file_path, template=ResumeTemplate.MINIMAL_BLUE
+                    )
+
+            assert sorted(os.listdir(temp_dir)) == ["first.yaml"]
+
+    @pytest.mark.asyncio
+    async def test_generate_bundle_with_invalid_resumes(self, resume_service, mock_renderer):
+        mock_renderer.render_resume.side_effect = [
+            SAMPLE_RENDERED_RESUME,
+            ResumeDataValidationError(jsonschema.exceptions.ValidationError("'name' is a required property")),
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file_paths = write_yaml_files(temp_dir, ["valid", "invalid"])
+            missing_file_path = os.path.join(temp_dir, "missing.yaml")
+            pdf_file_path = os.path.join(temp_dir, "bundle.pdf")
+
+            with pytest.raises(InvalidResumeError) as exc_info:
+                await resume_service.generate_bundle(
+                    [*yaml_file_paths, missing_file_path], pdf_file_path, template=ResumeTemplate.MINIMAL_BLUE
+                )
+
+            assert str(exc_info.value).splitlines() == [
+                f"{yaml_file_paths[1]}: Failed to validate resume data: 'name' is a required property",
+                f"{missing_file_path}: Could not open file: {missing_file_path}",
+            ]
+            assert not os.path.exists(pdf_file_path)
+        mock_renderer.generate_pdf.assert_not_called()
+        mock_renderer.render_error.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check(self, resume_service, mock_renderer):
+        laid_out_resume = MagicMock(spec=LaidOutResume)
+        laid_out_resume.overflow_warnings.return_value = []
+        mock_renderer.lay_out.return_value = laid_out_resume
+
+        with tempfile.NamedTemporaryFile(mode="w+", suffix=".yaml") as yaml_file:
+            yaml.dump({"v": 1}, yaml_file)
+
+            result = await resume_service.check(yaml_file.name, template=ResumeTemplate.MINIMAL_BLUE, max_pages=2)
+
+        assert result.passed
+        assert result.laid_out_resume is laid_out_resume
+        mock_renderer.lay_out.assert_called_once_with(SAMPLE_RENDERED_RESUME)
+        laid_out_resume.overflow_warnings.assert_called_once_with(2)
+        laid_out_resume.write_pdf.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check_page_overflow(self, resume_service, mock_renderer):
+        mock_renderer.lay_out.return_value.overflow_warnings.return_value = ["Resume has 3 pages"]
+
+        with tempfile.NamedTemporaryFile(mode="w+", suffix=".yaml") as yaml_file:
+            yaml.dump({"v": 1}, yaml_file)
+
+            result = await resume_service.check(yaml_file.name, template=ResumeTemplate.MINIMAL_BLUE, max_pages=2)
+
+        assert not result.passed
+        assert result.warnings == ["Resume has 3 pages"]
+
+    @pytest.mark.asyncio
+    async def test_check_validation_error(self, resume_service, mock_renderer):
+        library_error_message = "Missing required field: 'name'"
+        mock_renderer.render_resume.side_effect = ResumeDataValidationError(
+            jsonschema.exceptions.ValidationError(library_error_message)
+        )
+
+        with tempfile.NamedTemporaryFile(mode="w+", suffix=".yaml") as yaml_file:
+            yaml.dump({"v": 1}, yaml_file)
+
+            result = await resume_service.check(yaml_file.name, template=ResumeTemplate.MINIMAL_BLUE, max_pages=2)
+
+        assert not result.passed
+        assert result.errors == [f"Failed to validate resume data: {library_error_message}"]
+        mock_renderer.lay_out.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_generate_pdf_file_not_found(self, resume_service, mock_renderer):
         non_existent_file = "/path/that/does/not/exist.yaml"
@@ -217,6 +442,148 @@ class TestResumeService:
                 f"Failed to validate resume data: {library_error_message}",
             )
 
+    @pytest.mark.asyncio
+    async def test_only_error_details_are_sent_while_error_page_is_shown(self, resume_service, mock_renderer):
+        library_error_message = "Missing required field: 'name'"
+        mock_renderer.render_resume.side_effect = [
+            ResumeDataValidationError(jsonschema.exceptions.ValidationError(library_error_message)),
+            ResumeDataValidationError(jsonschema.exceptions.ValidationError(library_error_message)),
+            SAMPLE_RENDERED_RESUME,
+            ResumeDataValidationError(jsonschema.exceptions.ValidationError(library_error_message)),
+        ]
+
+        with tempfile.NamedTemporaryFile(mode="w+", suffix=".yaml") as yaml_file:
+            yaml.dump({"v": 1}, yaml_file)
+
+            file_change_simulator = FileChangeSimulator(
+                file_content_list=[yaml.dump({"v": 2}), yaml.dump({"v": 3}), yaml.dump({"v": 4})]
+            )
+
+            preview_recorder = PreviewRecorder()
+            with patch("src.service.awatch", file_change_simulator.fake_awatch):
+                await resume_service.show_previews(
+                    file_path=yaml_file.name,
+                    on_preview_updated=preview_recorder.on_preview_updated,
+                    template=ResumeTemplate.MINIMAL_BLUE,
+                )
+
+        assert preview_recorder.previews == [
+            SAMPLE_RENDERED_ERROR,
+            ERROR_DETAILS_MESSAGE_PREFIX + SAMPLE_RENDERED_ERROR_DETAILS,
+            SAMPLE_RENDERED_RESUME,
+            SAMPLE_RENDERED_ERROR,
+        ]
+        mock_renderer.render_error_details.assert_called_once_with(
+            f"Failed to validate resume data: {library_error_message}",
+        )
+
+    @pytest.mark.asyncio
+    async def test_watch_pdf(self, resume_service, mock_renderer):
+        first_pdf, second_pdf = b"FIRST_PDF", b"SECOND_PDF"
+        mock_renderer.render_resume.side_effect = ["<html>1</html>", "<html>1</html>", "<html>2</html>"]
+        mock_renderer.generate_pdf.side_effect = [first_pdf, second_pdf]
+        written_pdfs = []
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file_path = os.path.join(temp_dir, "cv.yaml")
+            pdf_file_path = os.path.join(temp_dir, "cv.pdf")
+            with open(yaml_file_path, "w") as yaml_file:
+                yaml.dump({"v": 1}, yaml_file)
+
+            async def on_pdf_written(output_path):
+                with open(output_path, "rb") as f:
+                    written_pdfs.append(f.read())
+
+            file_change_simulator = FileChangeSimulator(
+                file_content_list=[yaml.dump({"v": 1, "comment": "no visible change"}), yaml.dump({"v": 2})]
+            )
+            with patch("src.service.awatch", file_change_simulator.fake_awatch):
+                await resume_service.watch_pdf(
+                    cv_data_path=yaml_file_path,
+                    output_path=pdf_file_path,
+                    template=ResumeTemplate.MINIMAL_BLUE,
+                    on_pdf_written=on_pdf_written,
+                )
+
+            assert sorted(os.listdir(temp_dir)) == ["cv.pdf", "cv.yaml"], "No temporary files should be left behind."
+
+        assert written_pdfs == [first_pdf, second_pdf]
+        mock_renderer.generate_pdf.assert_has_calls([call("<html>1</html>"), call("<html>2</html>")])
+        assert mock_renderer.render_resume.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_watch_pdf_keeps_last_good_pdf_while_resume_is_invalid(self, resume_service, mock_renderer):
+        first_pdf, second_pdf = b"FIRST_PDF", b"SECOND_PDF"
+        mock_renderer.render_resume.side_effect = [
+            "<html>1</html>",
+            ResumeDataValidationError(jsonschema.exceptions.ValidationError("'name' is a required property")),
+            "<html>2</html>",
+        ]
+        mock_renderer.generate_pdf.side_effect = [first_pdf, second_pdf]
+        pdfs_after_each_change = []
+        errors = []
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file_path = os.path.join(temp_dir, "cv.yaml")
+            pdf_file_path = os.path.join(temp_dir, "cv.pdf")
+            with open(yaml_file_path, "w") as yaml_file:
+                yaml.dump({"v": 1}, yaml_file)
+
+            async def on_error(error_message):
+                errors.append(error_message)
+                with open(pdf_file_path, "rb") as f:
+                    pdfs_after_each_change.append(f.read())
+
+            file_change_simulator = FileChangeSimulator(
+                file_content_list=[yaml.dump({"v": 1}), "name: [", yaml.dump({"v": 2})]
+            )
+            with patch("src.service.awatch", file_change_simulator.fake_awatch):
+                await resume_service.watch_pdf(
+                    cv_data_path=yaml_file_path,
+                    output_path=pdf_file_path,
+                    template=ResumeTemplate.MINIMAL_BLUE,
+                    on_error=on_error,
+                )
+
+            with open(pdf_file_path, "rb") as f:
+                assert f.read() == second_pdf
+
+        assert errors == [
+            "Failed to validate resume data: 'name' is a required property",
+            f"Could not open file: {yaml_file_path}",
+        ]
+        assert pdfs_after_each_change == [first_pdf, first_pdf]
+        mock_renderer.render_error.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_watch_pdf_keeps_watching_after_a_failed_build(self, resume_service, mock_renderer):
+        mock_renderer.render_resume.side_effect = ["<html>1</html>", "<html>2</html>"]
+        mock_renderer.generate_pdf.side_effect = [RuntimeError("Pango error"), SAMPLE_PDF_BYTES]
+        errors = []
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file_path = os.path.join(temp_dir, "cv.yaml")
+            pdf_file_path = os.path.join(temp_dir, "cv.pdf")
+            with open(yaml_file_path, "w") as yaml_file:
+                yaml.dump({"v": 1}, yaml_file)
+
+            async def on_error(error_message):
+                errors.append(error_message)
+
+            file_change_simulator = FileChangeSimulator(file_content_list=[yaml.dump({"v": 2})])
+            with patch("src.service.awatch", file_change_simulator.fake_awatch):
+                await resume_service.watch_pdf(
+                    cv_data_path=yaml_file_path,
+                    output_path=pdf_file_path,
+                    template=ResumeTemplate.MINIMAL_BLUE,
+                    on_error=on_error,
+                )
+
+            with open(pdf_file_path, "rb") as f:
+                assert f.read() == SAMPLE_PDF_BYTES
+
+        assert errors == [f"Could not build {pdf_file_path}: Pango error"]
+
     def test_create_new_resume(self, resume_service):
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_dir_path = Path(temp_dir)
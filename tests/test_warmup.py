@@ -0,0 +1,30 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from src.renderer import ResumeTemplate
+from src.warmup import SAMPLE_RESUME_PATH, warm_up
+
+
+def test_warm_up_times_new_processes_with_and_without_the_template_fonts(tmp_path):
+    font_cache_dir = tmp_path / "fontconfig"
+    commands = []
+
+    def fake_run(command, env, **kwargs):
+        commands.append((command, env.get("RESUMECLI_FONT_CACHE_DIR"), env.get("FONTCONFIG_FILE")))
+
+    environment = {"RESUMECLI_FONT_CACHE_DIR": "/configured", "FONTCONFIG_FILE": "/configured/fonts.conf"}
+    with patch.dict(os.environ, environment), patch("src.warmup.subprocess.run", side_effect=fake_run):
+        result = warm_up(ResumeTemplate.MINIMAL_GREEN, font_cache_dir)
+
+    assert [(cache_dir, fontconfig_file) for _, cache_dir, fontconfig_file in commands] == [
+        (None, None),
+        (str(font_cache_dir), None),
+        (str(font_cache_dir), None),
+    ]
+    for command, _, _ in commands:
+        assert command[-6:-3] == ["build", str(SAMPLE_RESUME_PATH), "--output"]
+        assert command[-2:] == ["--template", "minimal_green"]
+        assert not Path(command[-4]).exists()
+    assert result.system_fonts_first_pdf_seconds >= 0
+    assert result.template_fonts_first_pdf_seconds >= 0
@@ -0,0 +1,94 @@
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from src.workers import RenderJobResult, RenderWorkerPool
+
+SAMPLE_PDF_BYTES = b"PDF_CONTENT"
+
+
+class FakeRenderWorker:
+    started: List["FakeRenderWorker"] = []
+
+    def __init__(self, context, rss_bytes: Optional[int] = 100):
+        self.jobs_done = 0
+        self.rss_bytes: Optional[int] = None
+        self.pid = len(FakeRenderWorker.started)
+        self.stopped = False
+        self.alive = True
+        self._rss_bytes = rss_bytes
+        FakeRenderWorker.started.append(self)
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def generate_pdf(self, rendered_resume: str) -> RenderJobResult:
+        self.jobs_done += 1
+        if rendered_resume == "crash":
+            self.alive = False
+            raise RuntimeError("worker crashed")
+        self.rss_bytes = self._rss_bytes
+        return RenderJobResult(pdf=SAMPLE_PDF_BYTES, peak_rss_bytes=self._rss_bytes, rss_bytes=self._rss_bytes)
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.fixture(autouse=True)
+def fake_render_worker():
+    FakeRenderWorker.started = []
+    with patch("src.workers._RenderWorker", FakeRenderWorker):
+        yield
+
+
+class TestRenderWorkerPool:
+    def test_workers_are_started_lazily(self):
+        with RenderWorkerPool(workers=2):
+            assert FakeRenderWorker.started == []
+
+    def test_worker_is_reused_between_jobs(self):
+        with RenderWorkerPool(workers=1, max_jobs_per_worker=10) as pool:
+            for _ in range(3):
+                assert pool.generate_pdf("<html></html>") == SAMPLE_PDF_BYTES
+
+        assert len(FakeRenderWorker.started) == 1
+        assert FakeRenderWorker.started[0].stopped
+
+    def test_worker_is_recycled_after_max_jobs(self):
+        with RenderWorkerPool(workers=1, max_jobs_per_worker=2) as pool:
+            for _ in range(5):
+                pool.generate_pdf("<html></html>")
+
+        assert [worker.jobs_done for worker in FakeRenderWorker.started] == [2, 2, 1]
+        assert all(worker.stopped for worker in FakeRenderWorker.started)
+
+    def test_worker_is_recycled_when_over_rss_limit(self):
+        with RenderWorkerPool(workers=1, max_jobs_per_worker=10, max_worker_rss_bytes=50) as pool:
+            for _ in range(2):
+                pool.generate_pdf("<html></html>")
+
+        assert [worker.jobs_done for worker in FakeRenderWorker.started] == [1, 1]
+
+    def test_crashed_worker_is_replaced(self):
+        with RenderWorkerPool(workers=1, max_jobs_per_worker=10) as pool:
+            with pytest.raises(RuntimeError):
+                pool.generate_pdf("crash")
+            assert pool.generate_pdf("<html></html>") == SAMPLE_PDF_BYTES
+
+        assert len(FakeRenderWorker.started) == 2
+        assert FakeRenderWorker.started[0].stopped
+
+    def test_slot_is_returned_when_starting_a_worker_fails(self):
+        with RenderWorkerPool(workers=1, max_jobs_per_worker=10) as pool:
+            with patch("src.workers._RenderWorker", side_effect=OSError("spawn failed")):
+                with pytest.raises(OSError):
+                    pool.generate_pdf("<html></html>")
+            assert pool.generate_pdf("<html></html>") == SAMPLE_PDF_BYTES
+
+        assert len(FakeRenderWorker.started) == 1
+        assert FakeRenderWorker.started[0].stopped
+
+    def test_pool_needs_at_least_one_worker(self):
+        with pytest.raises(ValueError):
+            RenderWorkerPool(workers=0)